@@ -0,0 +1,94 @@
+"""Benchmark AIProjectGenerator code emission at scale.
+
+Renders models.py, every component and AI_ANALYSIS.md for synthetic
+analyses with hundreds of models and components. Time per item should
+stay flat as the analysis grows.
+
+    python benchmarks/bench_ai_emission.py --sizes 100,200,400,800
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+from pathlib import Path
+
+import click
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from qstack.core.ai_integration import AIProjectAnalysis, ProjectFeature  # noqa: E402
+from qstack.core.ai_generator import AIProjectGenerator  # noqa: E402
+
+
+def build_analysis(item_count):
+    """Build an analysis with `item_count` models and `item_count` components."""
+    features = []
+    for i in range(0, item_count, 4):
+        features.append(ProjectFeature(
+            name=f'feature_{i}',
+            description=f'Synthetic feature number {i}',
+            models=[f'Task{i}', f'Category{i}', f'Profile{i}', f'Record{i}'],
+            components=[f'Task{i}List', f'Task{i}Form', f'Task{i}Item', f'Task{i}Panel'],
+            dependencies=[],
+            api_endpoints=[f'/api/tasks-{i}/'],
+        ))
+
+    return AIProjectAnalysis(
+        project_name='emission_bench',
+        description=f'Emission benchmark with {item_count} models',
+        features=features,
+        database_type='postgres',
+        template_type='fullstack',
+        additional_packages=[],
+    )
+
+
+def time_emission(generator):
+    """Return seconds spent emitting models, components and docs."""
+    start = time.perf_counter()
+    generator._create_models_file()
+    for name, data in generator.custom_components.items():
+        generator._create_component_file(name, data)
+    generator._generate_ai_documentation()
+    return time.perf_counter() - start
+
+
+@click.command()
+@click.option('--sizes', default='100,200,400,800', help='Comma-separated model/component counts')
+@click.option('--repeat', default=5, help='Runs per size (best time is reported)')
+@click.option('--json', 'as_json', is_flag=True, help='Print results as JSON')
+def main(sizes, repeat, as_json):
+    """Time template-driven emission for growing analyses."""
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        try:
+            for size in (int(s) for s in sizes.split(',')):
+                generator = AIProjectGenerator('emission_bench', build_analysis(size))
+                Path('emission_bench').mkdir(exist_ok=True)
+                best = min(time_emission(generator) for _ in range(repeat))
+                items = len(generator.custom_models) + len(generator.custom_components)
+                results.append({
+                    'models': len(generator.custom_models),
+                    'components': len(generator.custom_components),
+                    'emit_s': round(best, 4),
+                    'us_per_item': round(best / items * 1e6, 1),
+                })
+        finally:
+            os.chdir(cwd)
+
+    if as_json:
+        click.echo(json.dumps(results, indent=2))
+        return
+
+    click.echo(f"{'models':>8}{'comps':>8}{'emit_s':>10}{'us/item':>10}")
+    for row in results:
+        click.echo(f"{row['models']:>8}{row['components']:>8}{row['emit_s']:>10.4f}{row['us_per_item']:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""Benchmark the `startproject --ai` path against replayed Claude responses.
+
+Runs ``analyze_project_requirements -> AIProjectGenerator.generate`` offline
+for synthetic analyses of increasing size, plus the fallback path with an
+injected API failure.
+
+    python benchmarks/bench_ai_generation.py --sizes 1,10,50 --latency 0.2
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+from pathlib import Path
+
+import click
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from qstack.core.ai_replay import ReplayClaudeAnalyzer, write_fixture  # noqa: E402
+from qstack.core.ai_generator import AIProjectGenerator  # noqa: E402
+
+
+def build_response(feature_count):
+    """Build a Claude-style JSON response with `feature_count` features."""
+    features = []
+    for i in range(feature_count):
+        features.append({
+            'name': f'feature_{i}',
+            'description': f'Synthetic feature number {i}',
+            'models': [f'Record{i}', f'Category{i}', f'Profile{i}'],
+            'components': [f'Record{i}List', f'Record{i}Form', f'Record{i}Item'],
+            'dependencies': [],
+            'api_endpoints': [f'/api/records-{i}/'],
+        })
+
+    return "Here is the analysis:\n" + json.dumps({
+        'project_name': f'bench_project_{feature_count}',
+        'description': f'Benchmark project with {feature_count} features',
+        'database_type': 'postgres',
+        'template_type': 'fullstack',
+        'features': features,
+        'additional_packages': ['axios'],
+    })
+
+
+def run_once(fixtures_dir, description, latency, error_rate):
+    """Analyze and generate once, returning (analyze_s, generate_s, analysis)."""
+    analyzer = ReplayClaudeAnalyzer(fixtures_dir, latency=latency,
+                                    error_rate=error_rate, seed=0)
+
+    start = time.perf_counter()
+    analysis = analyzer.analyze_project_requirements(description)
+    analyzed = time.perf_counter()
+    AIProjectGenerator(analysis.project_name, analysis).generate()
+    generated = time.perf_counter()
+
+    return analyzed - start, generated - analyzed, analysis
+
+
+@click.command()
+@click.option('--sizes', default='1,10,50,200', help='Comma-separated feature counts')
+@click.option('--repeat', default=3, help='Runs per size (best time is reported)')
+@click.option('--latency', default=0.0, help='Injected API latency in seconds')
+@click.option('--json', 'as_json', is_flag=True, help='Print results as JSON')
+def main(sizes, repeat, latency, as_json):
+    """Time the offline AI generation path at several analysis sizes."""
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        fixtures_dir = Path(tmp) / 'fixtures'
+        work_dir = Path(tmp) / 'work'
+        work_dir.mkdir()
+        cwd = os.getcwd()
+        os.chdir(work_dir)
+
+        try:
+            scenarios = [(int(size), 0.0) for size in sizes.split(',')]
+            scenarios.append((0, 1.0))  # fallback path
+
+            for size, error_rate in scenarios:
+                description = f'benchmark app with {size} features'
+                prompt = ReplayClaudeAnalyzer(fixtures_dir)._create_analysis_prompt(description)
+                write_fixture(fixtures_dir, prompt, build_response(size))
+
+                timings = [run_once(fixtures_dir, description, latency, error_rate)
+                           for _ in range(repeat)]
+                analyze_s = min(t[0] for t in timings)
+                generate_s = min(t[1] for t in timings)
+                analysis = timings[-1][2]
+
+                results.append({
+                    'scenario': 'fallback' if error_rate else f'{size} features',
+                    'models': sum(len(f.models) for f in analysis.features),
+                    'components': sum(len(f.components) for f in analysis.features),
+                    'analyze_s': round(analyze_s, 4),
+                    'generate_s': round(generate_s, 4),
+                    'total_s': round(analyze_s + generate_s, 4),
+                })
+        finally:
+            os.chdir(cwd)
+
+    if as_json:
+        click.echo(json.dumps(results, indent=2))
+        return
+
+    click.echo(f"{'scenario':<16}{'models':>8}{'comps':>8}{'analyze':>10}{'generate':>10}{'total':>10}")
+    for row in results:
+        click.echo(f"{row['scenario']:<16}{row['models']:>8}{row['components']:>8}"
+                   f"{row['analyze_s']:>10.4f}{row['generate_s']:>10.4f}{row['total_s']:>10.4f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark the stock JSONRenderer against the generated orjson renderer.
+
+Generates an api-only SQLite project with --json orjson, seeds the todo
+table and, inside that project, serves GET /api/todos/ through Django's
+test client at each page size with each renderer. Rendering is also timed
+on its own, so the table shows how much of a list request is spent
+encoding JSON.
+
+    python benchmarks/bench_json_renderers.py --page-sizes 20,100,1000 --rounds 200
+"""
+
+import json
+
+import click
+
+from support import measure_in_project, per_call, setup_django
+
+
+def measure(project_name, page_sizes, rounds):
+    """Time list requests and rendering per renderer and page size (runs inside the project)."""
+    setup_django(project_name)
+
+    from django.test import Client
+    from rest_framework.pagination import PageNumberPagination
+    from rest_framework.renderers import JSONRenderer
+    from todos.views import TodoViewSet
+
+    renderers = __import__(f'{project_name}_project.renderers', fromlist=['ORJSONRenderer'])
+    client = Client()
+    results = []
+    for page_size in page_sizes:
+        TodoViewSet.pagination_class = type('BenchPagination', (PageNumberPagination,), {'page_size': page_size})
+        for renderer in (JSONRenderer, renderers.ORJSONRenderer):
+            TodoViewSet.renderer_classes = [renderer]
+            response = client.get('/api/todos/')
+            assert response.status_code == 200, response.status_code
+            data = response.data
+
+            render_s = per_call(lambda: renderer().render(data), rounds)
+            request_s = per_call(lambda: client.get('/api/todos/'), rounds)
+            results.append({
+                'page_size': page_size,
+                'renderer': renderer.__name__,
+                'bytes': len(response.content),
+                'render_us': round(render_s * 1e6, 1),
+                'request_ms': round(request_s * 1e3, 3),
+                'render_share': round(render_s / request_s, 3),
+            })
+    return results
+
+
+@click.command()
+@click.option('--page-sizes', default='20,100,1000', help='Comma-separated PAGE_SIZE values')
+@click.option('--rounds', default=200, help='Timed calls per measurement')
+@click.option('--json', 'as_json', is_flag=True, help='Print results as JSON')
+@click.option('--measure-in', hidden=True, help='Internal: measure inside this generated project')
+def main(page_sizes, rounds, as_json, measure_in):
+    """Compare list rendering with DRF's JSONRenderer and the orjson renderer."""
+    sizes = [int(size) for size in page_sizes.split(',')]
+    if measure_in:
+        click.echo(json.dumps(measure(measure_in, sizes, rounds)))
+        return
+
+    results = measure_in_project(__file__, 'bench_json', max(sizes),
+                                 ['--page-sizes', page_sizes, '--rounds', str(rounds)], json_backend='orjson')
+
+    if as_json:
+        click.echo(json.dumps(results, indent=2))
+        return
+
+    click.echo(f"{'page':>6}{'renderer':>16}{'bytes':>10}{'render_us':>12}{'request_ms':>12}{'render%':>9}")
+    for row in results:
+        click.echo(f"{row['page_size']:>6}{row['renderer']:>16}{row['bytes']:>10}{row['render_us']:>12.1f}"
+                   f"{row['request_ms']:>12.3f}{row['render_share'] * 100:>8.1f}%")
+
+
+if __name__ == '__main__':
+    main()
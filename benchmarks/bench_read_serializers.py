@@ -0,0 +1,90 @@
+"""Benchmark list serialization: ModelSerializer vs the generated lean read path.
+
+Generates an api-only SQLite project, seeds the todo table and, inside
+that project, measures rows per second two ways for each row count:
+
+- serialize: fetch and serialize N rows with TodoSerializer (model
+  instances) and with RowSerializer (.values() rows)
+- request: GET /api/todos/ with PAGE_SIZE=N through Django's test client,
+  with LeanListMixin enabled and disabled
+
+    python benchmarks/bench_read_serializers.py --rows 20,100,1000 --rounds 50
+"""
+
+import json
+
+import click
+
+from support import measure_in_project, per_call, setup_django
+
+
+def measure(project_name, row_counts, rounds):
+    """Time serialization and list requests per path and row count (runs inside the project)."""
+    setup_django(project_name)
+
+    from django.test import Client
+    from rest_framework.pagination import PageNumberPagination
+    from todos.models import Todo
+    from todos.serializers import TodoSerializer
+    from todos.views import TodoViewSet
+
+    lean = __import__(f'{project_name}_project.lean', fromlist=['row_serializer'])
+    rows = lean.row_serializer(TodoSerializer)
+    assert rows is not None, 'TodoSerializer should be eligible for the lean path'
+
+    paths = {
+        'ModelSerializer': (lambda n: TodoSerializer(Todo.objects.all()[:n], many=True).data,
+                            lambda self: None),
+        'RowSerializer': (lambda n: rows.serialize_rows(Todo.objects.values(*rows.columns)[:n]),
+                          lean.LeanListMixin.get_row_serializer),
+    }
+    client = Client()
+    results = []
+    for count in row_counts:
+        TodoViewSet.pagination_class = type('BenchPagination', (PageNumberPagination,), {'page_size': count})
+        expected = None
+        for name, (serialize, get_row_serializer) in paths.items():
+            TodoViewSet.get_row_serializer = get_row_serializer
+            body = client.get('/api/todos/').json()
+            expected = expected or body
+            assert body == expected, f'{name} output differs'
+
+            serialize_s = per_call(lambda: serialize(count), rounds)
+            request_s = per_call(lambda: client.get('/api/todos/'), rounds)
+            results.append({
+                'rows': count,
+                'path': name,
+                'serialize_rows_per_s': round(count / serialize_s),
+                'request_rows_per_s': round(count / request_s),
+                'request_ms': round(request_s * 1e3, 3),
+            })
+    return results
+
+
+@click.command()
+@click.option('--rows', 'row_counts', default='20,100,1000', help='Comma-separated rows per page')
+@click.option('--rounds', default=50, help='Timed calls per measurement')
+@click.option('--json', 'as_json', is_flag=True, help='Print results as JSON')
+@click.option('--measure-in', hidden=True, help='Internal: measure inside this generated project')
+def main(row_counts, rounds, as_json, measure_in):
+    """Compare rows/second of ModelSerializer and the lean .values() list path."""
+    counts = [int(count) for count in row_counts.split(',')]
+    if measure_in:
+        click.echo(json.dumps(measure(measure_in, counts, rounds)))
+        return
+
+    results = measure_in_project(__file__, 'bench_read', max(counts),
+                                 ['--rows', row_counts, '--rounds', str(rounds)])
+
+    if as_json:
+        click.echo(json.dumps(results, indent=2))
+        return
+
+    click.echo(f"{'rows':>6}{'path':>17}{'serialize rows/s':>18}{'request rows/s':>16}{'request_ms':>12}")
+    for row in results:
+        click.echo(f"{row['rows']:>6}{row['path']:>17}{row['serialize_rows_per_s']:>18}"
+                   f"{row['request_rows_per_s']:>16}{row['request_ms']:>12.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+"""Benchmark generated backends under WSGI and ASGI server modes.
+
+Generates an api-only SQLite project per server mode, seeds the todo
+table and serves it with the project's own gunicorn.conf.py (gthread
+workers for --server wsgi, uvicorn workers for --server asgi). Each
+concurrency level is measured with keep-alive HTTP/1.1 clients issuing
+GET /api/todos/ for a fixed duration.
+
+    python benchmarks/bench_server_modes.py --concurrency 1,16,64 --duration 5
+
+SQLite queries are local and fast, so this mostly compares per-request
+server and view overhead; async views pay off when requests wait on a
+networked database or upstream API.
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import asyncio
+import tempfile
+import subprocess
+
+import click
+
+from support import generate_project  # also puts the repository on sys.path
+from qstack.core.generator import SERVER_MODES
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(project, server, workers):
+    """Start gunicorn with the generated config and wait until it accepts connections."""
+    port = free_port()
+    env = dict(os.environ,
+               DEBUG='False',
+               GUNICORN_BIND=f'127.0.0.1:{port}',
+               GUNICORN_WORKERS=str(workers),
+               GUNICORN_ACCESS_LOG='/dev/null',
+               GUNICORN_LOG_LEVEL='warning')
+    module = 'asgi:application' if server == 'asgi' else 'wsgi'
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '--config', 'gunicorn.conf.py', f'{project.name}_project.{module}'],
+        cwd=project, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise click.ClickException(f'gunicorn exited with {process.returncode} for {server}')
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.2).close()
+            return process, port
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise click.ClickException(f'gunicorn did not start for {server}')
+
+
+async def fetch(reader, writer, request):
+    """Send one keep-alive request and return its status code."""
+    writer.write(request)
+    await writer.drain()
+    head = await reader.readuntil(b'\r\n\r\n')
+    status = int(head.split(b' ', 2)[1])
+    length = 0
+    for line in head.split(b'\r\n')[1:]:
+        if line.lower().startswith(b'content-length:'):
+            length = int(line.split(b':', 1)[1])
+    await reader.readexactly(length)
+    return status
+
+
+async def client(port, path, stop_at, latencies, errors):
+    """Issue requests over one connection until `stop_at`."""
+    request = f'GET {path} HTTP/1.1\r\nHost: 127.0.0.1\r\nAccept: application/json\r\n\r\n'.encode()
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    try:
+        while time.perf_counter() < stop_at:
+            start = time.perf_counter()
+            try:
+                status = await fetch(reader, writer, request)
+            except (OSError, asyncio.IncompleteReadError):
+                errors.append(1)
+                writer.close()
+                reader, writer = await asyncio.open_connection('127.0.0.1', port)
+                continue
+            latencies.append(time.perf_counter() - start)
+            if status >= 400:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+async def load(port, path, concurrency, duration):
+    """Run `concurrency` clients for `duration` seconds."""
+    latencies, errors = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, path, start + duration, latencies, errors)
+                           for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': len(errors),
+        'rps': round(len(latencies) / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 2) if latencies else None,
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 2) if latencies else None,
+    }
+
+
+@click.command()
+@click.option('--servers', default=','.join(SERVER_MODES), help='Comma-separated server modes')
+@click.option('--concurrency', default='1,16,64', help='Comma-separated concurrent connections')
+@click.option('--duration', default=5.0, help='Seconds per concurrency level')
+@click.option('--workers', default=1, help='Gunicorn worker processes per server')
+@click.option('--seed', default=200, help='Todos created before measuring')
+@click.option('--path', default='/api/todos/', help='Endpoint to request')
+@click.option('--json', 'as_json', is_flag=True, help='Print results as JSON')
+def main(servers, concurrency, duration, workers, seed, path, as_json):
+    """Compare request throughput and latency of --server wsgi and asgi."""
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        try:
+            for server in servers.split(','):
+                project = generate_project(f'bench_{server}', seed, server=server)
+                process, port = start_server(project, server, workers)
+                try:
+                    asyncio.run(load(port, path, 1, min(duration, 1.0)))  # warm up
+                    for level in (int(c) for c in concurrency.split(',')):
+                        row = asyncio.run(load(port, path, level, duration))
+                        results.append(dict(server=server, concurrency=level, **row))
+                finally:
+                    process.terminate()
+                    process.wait(timeout=30)
+        finally:
+            os.chdir(cwd)
+
+    if as_json:
+        click.echo(json.dumps(results, indent=2))
+        return
+
+    click.echo(f"{'server':>8}{'conc':>6}{'requests':>10}{'errors':>8}{'req/s':>10}{'p50_ms':>9}{'p99_ms':>9}")
+    for row in results:
+        click.echo(f"{row['server']:>8}{row['concurrency']:>6}{row['requests']:>10}{row['errors']:>8}"
+                   f"{row['rps']:>10.1f}{row['p50_ms'] or 0:>9.2f}{row['p99_ms'] or 0:>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
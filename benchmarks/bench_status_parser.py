@@ -0,0 +1,91 @@
+"""Benchmark StatusParser on large defineprojectscope.md files.
+
+Generates scope files mixing all three feature formats (plus a malformed
+variant with headings that never get a status line) and reports parse time
+and peak Python memory. Time per feature should stay flat as files grow.
+
+    python benchmarks/bench_status_parser.py --sizes 10000,50000,100000
+"""
+
+import sys
+import json
+import time
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+import click
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from qstack.core.status_parser import StatusParser  # noqa: E402
+
+
+def write_scope_file(path, feature_count, malformed=False):
+    """Write a scope file with `feature_count` features."""
+    with open(path, 'w') as f:
+        f.write("# Project Scope\n\n## Features\n\n")
+        for i in range(feature_count):
+            kind = i % 3
+            if malformed:
+                f.write(f"### {i}. **Feature {i}**\n- **Description**: never finished\n\n")
+            elif kind == 0:
+                f.write(f"- [{'x' if i % 2 else ' '}] Feature {i}\n  - Checkbox feature {i}\n")
+            elif kind == 1:
+                f.write(f"{i}. **Feature {i}**\n   - **Description**: Numbered feature {i}\n"
+                        f"   - **Status**: Implemented ✓\n")
+            else:
+                f.write(f"### {i}. **Feature {i}**\n- **Description**: Heading feature {i}\n"
+                        f"- **Status**: Pending\n- **Location**: `src/feature_{i}.py`\n\n")
+        f.write("## Next Steps\n- Ship it\n- Celebrate\n")
+
+
+def measure(path):
+    """Return (seconds, peak_bytes, feature_count) for one parse."""
+    start = time.perf_counter()
+    progress = StatusParser(path).get_progress()
+    elapsed = time.perf_counter() - start
+
+    # Separate traced run so allocation tracking doesn't skew the timing
+    tracemalloc.start()
+    StatusParser(path).get_progress()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, len(progress['features'])
+
+
+@click.command()
+@click.option('--sizes', default='10000,50000,100000', help='Comma-separated feature counts')
+@click.option('--json', 'as_json', is_flag=True, help='Print results as JSON')
+def main(sizes, as_json):
+    """Time single-pass scope parsing for growing files."""
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in (int(s) for s in sizes.split(',')):
+            for malformed in (False, True):
+                path = Path(tmp) / 'defineprojectscope.md'
+                write_scope_file(path, size, malformed=malformed)
+                elapsed, peak, parsed = measure(path)
+                results.append({
+                    'features': size,
+                    'malformed': malformed,
+                    'file_kb': path.stat().st_size // 1024,
+                    'parsed': parsed,
+                    'parse_s': round(elapsed, 4),
+                    'us_per_feature': round(elapsed / size * 1e6, 2),
+                    'peak_kb': peak // 1024,
+                })
+
+    if as_json:
+        click.echo(json.dumps(results, indent=2))
+        return
+
+    click.echo(f"{'features':>10}{'malformed':>11}{'file_kb':>9}{'parsed':>8}{'parse_s':>9}{'us/feat':>9}{'peak_kb':>9}")
+    for row in results:
+        click.echo(f"{row['features']:>10}{str(row['malformed']):>11}{row['file_kb']:>9}{row['parsed']:>8}"
+                   f"{row['parse_s']:>9.4f}{row['us_per_feature']:>9.2f}{row['peak_kb']:>9}")
+
+
+if __name__ == '__main__':
+    main()
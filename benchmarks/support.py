@@ -0,0 +1,69 @@
+"""Shared setup for benchmarks that run against a generated project.
+
+Benchmarks generate an api-only SQLite project in a temporary directory,
+migrate it and seed its todo table. Those that time Django code re-run
+their own script inside the project with `--measure-in <name>` and
+DEBUG=False, so django.setup() loads the generated settings, and print
+their results as JSON for the parent to report.
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+import subprocess
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from qstack.core.generator import ProjectGenerator  # noqa: E402
+
+SEED_SCRIPT = (
+    "from todos.models import Todo; "
+    "Todo.objects.bulk_create([Todo(title=f'todo {{i}}', completed=i % 2 == 0) for i in range({count})])"
+)
+
+
+def generate_project(name, seed, **options):
+    """Generate, migrate and seed an api-only project in the current directory."""
+    ProjectGenerator(name, 'api-only', 'sqlite', **options).generate()
+    project = Path(name).resolve()
+    for args in (['makemigrations', 'todos'], ['migrate'], ['shell', '-c', SEED_SCRIPT.format(count=seed)]):
+        subprocess.run([sys.executable, 'manage.py', *args], cwd=project, check=True,
+                       stdout=subprocess.DEVNULL)
+    return project
+
+
+def per_call(func, rounds):
+    """Return the mean seconds per call of `func` over `rounds` calls, after a warm-up."""
+    for _ in range(min(rounds, 10)):
+        func()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds
+
+
+def setup_django(project_name):
+    """Load the generated project's settings (call from inside the project directory)."""
+    sys.path.insert(0, os.getcwd())
+    os.environ['DJANGO_SETTINGS_MODULE'] = f'{project_name}_project.settings'
+    import django
+    django.setup()
+
+
+def measure_in_project(script, name, seed, args, **options):
+    """Generate a seeded project, re-run `script` inside it and return its JSON output."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        try:
+            project = generate_project(name, seed, **options)
+            output = subprocess.run(
+                [sys.executable, str(Path(script).resolve()), *args, '--measure-in', project.name],
+                cwd=project, env=dict(os.environ, DEBUG='False'), check=True,
+                capture_output=True, text=True).stdout
+        finally:
+            os.chdir(cwd)
+    return json.loads(output)
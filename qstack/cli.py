@@ -54,6 +54,8 @@ def main(ctx, no_banner):
 from .commands.up import up
 from .commands.down import down
 from .commands.logs import logs
+from .commands.profile_api import profile_api
+from .commands.bench import bench
 from .commands.ai_context import ai_context, ai_help, add_feature, generate_context
 
 # Register commands
@@ -63,6 +65,8 @@ main.add_command(build)
 main.add_command(up)
 main.add_command(down)
 main.add_command(logs)
+main.add_command(profile_api, name='profile-api')
+main.add_command(bench)
 
 # Register AI context commands
 main.add_command(ai_context, name='ai-context')
@@ -5,12 +5,27 @@ import json
 import click
 from pathlib import Path
 from colorama import Fore, Style
+from ..core.code_indexer import CodeIndexer
+from ..core.context_index import ContextIndex
+from ..core.context_packer import ContextPacker
+from ..core.context_inputs import (
+    ContextState, detect_database, detect_template_type,
+    input_fingerprint, load_compose
+)
 from ..core.generator import ProjectGenerator
+from ..core.utils import atomic_write
+
+CONTEXT_TEMPLATE = Path(__file__).parent.parent / 'templates' / 'qstack-context.md.j2'
 
 @click.command()
 @click.option('--format', '-f', type=click.Choice(['full', 'structure', 'quick']), 
               default='full', help='Context display format')
-def ai_context(format):
+@click.option('--section', '-s', 'sections', multiple=True,
+              help='Show only sections whose heading contains NAME (repeatable)')
+@click.option('--max-tokens', type=click.IntRange(min=1),
+              help='Pack the most relevant context into this many (estimated) tokens')
+@click.option('--focus', help='File path or feature name to rank context against')
+def ai_context(format, sections, max_tokens, focus):
     """Display AI-readable project context.
     
     Shows comprehensive project information that AI tools can use
@@ -22,7 +37,11 @@ def ai_context(format):
         click.echo(f"{Fore.RED}❌ No QStack context found. Run this in a QStack project root.{Style.RESET_ALL}")
         return
     
-    if format == 'quick':
+    if max_tokens or focus:
+        _show_packed_context(max_tokens, focus)
+    elif sections:
+        _show_sections(sections)
+    elif format == 'quick':
         _show_quick_context()
     elif format == 'structure':
         _show_structure_only()
@@ -39,6 +58,8 @@ def ai_help():
     click.echo("  qstack ai-context           # Show full project context")
     click.echo("  qstack ai-context --format=quick  # Show condensed context")
     click.echo("  qstack ai-context --format=structure  # Show only structure")
+    click.echo("  qstack ai-context --section schema  # Show matching sections only")
+    click.echo("  qstack ai-context --max-tokens 1500 --focus backend/todos  # Budgeted, focused context")
     click.echo("  qstack generate-context      # Regenerate context files")
     
     click.echo(f"\n{Fore.GREEN}🚀 Development Commands:{Style.RESET_ALL}")
@@ -98,8 +119,14 @@ def add_feature(feature_description, implement):
         click.echo(f"\n{Fore.BLUE}💡 Use --implement flag to generate this feature automatically{Style.RESET_ALL}")
 
 @click.command()
-def generate_context():
-    """Regenerate AI context files for current project."""
+@click.option('--force', is_flag=True, help='Regenerate even if project inputs are unchanged')
+def generate_context(force):
+    """Regenerate AI context files for current project.
+    
+    Skips regeneration when the compose file, directory layout,
+    AI_ANALYSIS.md and models are unchanged since the last run, so it is
+    cheap enough for git or editor-save hooks.
+    """
     
     # Check if we're in a QStack project by looking for key files
     has_docker_compose = Path('docker-compose.yml').exists()
@@ -110,103 +137,103 @@ def generate_context():
         click.echo(f"{Fore.RED}❌ Not in a QStack project directory.{Style.RESET_ALL}")
         return
     
+    code_index = CodeIndexer().summary()
+    state = ContextState()
+    fingerprint = input_fingerprint(template_path=CONTEXT_TEMPLATE, extra=code_index)
+    outputs_exist = Path('.qstack-context.md').exists() and Path('.cursor-context').exists()
+    
+    if not force and outputs_exist and state.is_current(fingerprint):
+        click.echo(f"{Fore.GREEN}✅ Context files are up to date.{Style.RESET_ALL}")
+        return
+    
     click.echo(f"{Fore.CYAN}🔄 Regenerating AI context files...{Style.RESET_ALL}")
     
     # Analyze current project structure
-    project_info = _analyze_current_project()
+    project_info = _analyze_current_project(code_index)
     
     # Generate context files
     _generate_qstack_context(project_info)
     _generate_cursor_context(project_info)
+    state.record(fingerprint)
     
     click.echo(f"{Fore.GREEN}✅ Context files updated!{Style.RESET_ALL}")
     click.echo("  📝 .qstack-context.md - Master AI context")
     click.echo("  🎯 .cursor-context - Cursor IDE integration")
 
+def _echo_section(index, section, color):
+    """Print one indexed section with a colored heading."""
+    heading, _, body = index.read(section).partition('\n')
+    click.echo(f"{color}{heading}{Style.RESET_ALL}")
+    click.echo(body, nl=False)
+
+def _show_sections(names):
+    """Show sections matching the given heading names."""
+    try:
+        index = ContextIndex('.qstack-context.md')
+        for name in names:
+            matches = index.find(name)
+            if not matches:
+                click.echo(f"{Fore.YELLOW}⚠️  No section matching '{name}'{Style.RESET_ALL}")
+            for section in matches:
+                _echo_section(index, section, Fore.CYAN)
+    except FileNotFoundError:
+        click.echo(f"{Fore.RED}❌ Context file not found{Style.RESET_ALL}")
+
+def _show_packed_context(max_tokens, focus):
+    """Show the context sections and code facts most relevant to `focus`."""
+    try:
+        packer = ContextPacker(ContextIndex('.qstack-context.md'), CodeIndexer().summary())
+        text, tokens, cached = packer.pack(max_tokens=max_tokens, focus=focus)
+    except FileNotFoundError:
+        click.echo(f"{Fore.RED}❌ Context file not found{Style.RESET_ALL}")
+        return
+    
+    click.echo(text, nl=False)
+    budget = f" of {max_tokens}" if max_tokens else ""
+    click.echo(f"{Fore.BLUE}≈{tokens}{budget} tokens{' (cached)' if cached else ''}{Style.RESET_ALL}", err=True)
+
 def _show_quick_context():
     """Show condensed project context."""
     try:
-        with open('.qstack-context.md', 'r') as f:
-            content = f.read()
-        
-        # Extract key sections
-        lines = content.split('\n')
-        in_metadata = False
-        in_commands = False
-        
-        for line in lines:
-            if '## 📋 Project Metadata' in line:
-                in_metadata = True
-                click.echo(f"{Fore.CYAN}{line}{Style.RESET_ALL}")
-            elif '## 🛠️ Development Commands' in line:
-                in_commands = True
-                click.echo(f"{Fore.GREEN}{line}{Style.RESET_ALL}")
-            elif line.startswith('## ') and (in_metadata or in_commands):
-                in_metadata = False
-                in_commands = False
-            elif in_metadata or in_commands:
-                click.echo(line)
-                
+        index = ContextIndex('.qstack-context.md')
+        for section in index.find('Project Metadata'):
+            _echo_section(index, section, Fore.CYAN)
+        for section in index.find('Development Commands'):
+            _echo_section(index, section, Fore.GREEN)
     except FileNotFoundError:
         click.echo(f"{Fore.RED}❌ Context file not found{Style.RESET_ALL}")
 
 def _show_structure_only():
     """Show only project structure."""
     try:
-        with open('.qstack-context.md', 'r') as f:
-            content = f.read()
-        
-        # Extract structure section
-        lines = content.split('\n')
-        in_structure = False
-        
-        for line in lines:
-            if '## 🏗️ Architecture Overview' in line:
-                in_structure = True
-                click.echo(f"{Fore.CYAN}{line}{Style.RESET_ALL}")
-            elif line.startswith('## ') and in_structure:
-                break
-            elif in_structure:
-                click.echo(line)
-                
+        index = ContextIndex('.qstack-context.md')
+        for section in index.find('Architecture Overview')[:1]:
+            _echo_section(index, section, Fore.CYAN)
     except FileNotFoundError:
         click.echo(f"{Fore.RED}❌ Context file not found{Style.RESET_ALL}")
 
 def _show_full_context():
     """Show full context file."""
     try:
+        # Stream in chunks instead of holding the whole file in memory
         with open('.qstack-context.md', 'r') as f:
-            content = f.read()
-        click.echo(content)
+            for chunk in iter(lambda: f.read(64 * 1024), ''):
+                click.echo(chunk, nl=False)
+        click.echo()
     except FileNotFoundError:
         click.echo(f"{Fore.RED}❌ Context file not found{Style.RESET_ALL}")
 
-def _analyze_current_project():
+def _analyze_current_project(code_index):
     """Analyze current project structure."""
-    project_name = Path.cwd().name
-    
-    # Detect project type
-    template_type = 'fullstack'
-    if Path('frontend').exists() and not Path('backend').exists():
-        template_type = 'frontend-only'
-    elif Path('backend').exists() and not Path('frontend').exists():
-        template_type = 'api-only'
-    
-    # Detect database
-    database = 'postgres'  # Default
-    if Path('docker-compose.yml').exists():
-        with open('docker-compose.yml', 'r') as f:
-            compose_content = f.read()
-            if 'mysql' in compose_content:
-                database = 'mysql'
-            elif 'sqlite' in compose_content:
-                database = 'sqlite'
-    
     return {
-        'project_name': project_name,
-        'template_type': template_type,
-        'database': database,
-        'ai_generated': Path('AI_ANALYSIS.md').exists()
+        'project_name': Path.cwd().name,
+        'template_type': detect_template_type(),
+        'database': detect_database(load_compose()),
+        'ai_generated': Path('AI_ANALYSIS.md').exists(),
+        'code_index': code_index,
+        'custom_models': code_index['models'],
+        'custom_components': code_index['components'],
+        'api_routes': code_index['routes']
     }
 
 def _generate_qstack_context(project_info):
@@ -223,13 +250,9 @@ def _generate_qstack_context(project_info):
     }
     
     # Load and render template
-    templates_dir = Path(__file__).parent.parent / 'templates'
-    env = Environment(loader=FileSystemLoader(templates_dir))
-    template = env.get_template('qstack-context.md.j2')
-    content = template.render(**context)
-    
-    with open('.qstack-context.md', 'w') as f:
-        f.write(content)
+    env = Environment(loader=FileSystemLoader(CONTEXT_TEMPLATE.parent))
+    template = env.get_template(CONTEXT_TEMPLATE.name)
+    atomic_write('.qstack-context.md', template.render(**context))
 
 def _generate_cursor_context(project_info):
     """Generate .cursor-context file for Cursor IDE."""
@@ -244,7 +267,7 @@ This is a QStack-generated {project_info['template_type']} application.
 - `qstack status` - Check implementation status
 
 ### Key Files
-{_get_key_files_list(project_info['template_type'], project_info['project_name'])}
+{_get_key_files_list(project_info['template_type'], project_info['project_name'], project_info['code_index'])}
 
 ### Architecture
 - **Type**: {project_info['template_type']}
@@ -257,24 +280,38 @@ This is a QStack-generated {project_info['template_type']} application.
 For full context, see .qstack-context.md
 """
     
-    with open('.cursor-context', 'w') as f:
-        f.write(content)
+    atomic_write('.cursor-context', content)
 
-def _get_key_files_list(template_type, project_name):
-    """Get list of key files based on template type."""
+def _get_key_files_list(template_type, project_name, code_index):
+    """Get list of key files based on template type and indexed code."""
+    snake = project_name.replace('-', '_')
     if template_type == 'fullstack':
-        return f"""- `frontend/src/App.jsx` - Main React application
-- `backend/{project_name.replace('-', '_')}_project/settings.py` - Django settings
-- `backend/todos/models.py` - Database models
-- `docker-compose.yml` - Container orchestration"""
+        files = [
+            "- `frontend/src/App.jsx` - Main React application",
+            f"- `backend/{snake}_project/settings.py` - Django settings",
+        ]
     elif template_type == 'frontend-only':
-        return """- `src/App.jsx` - Main React application
-- `package.json` - Dependencies and scripts
-- `vite.config.js` - Build configuration"""
+        files = [
+            "- `src/App.jsx` - Main React application",
+            "- `package.json` - Dependencies and scripts",
+            "- `vite.config.js` - Build configuration",
+        ]
     else:  # api-only
-        return f"""- `{project_name.replace('-', '_')}_project/settings.py` - Django settings
-- `todos/models.py` - Database models
-- `todos/views.py` - API endpoints"""
+        files = [f"- `{snake}_project/settings.py` - Django settings"]
+    
+    # Files that actually define models and endpoints, grouped per file
+    by_file = {}
+    for name, model in code_index['models'].items():
+        by_file.setdefault(model['path'], {}).setdefault('Models', []).append(name)
+    for name, viewset in code_index['viewsets'].items():
+        by_file.setdefault(viewset['path'], {}).setdefault('ViewSets', []).append(name)
+    for path, kinds in sorted(by_file.items()):
+        summary = '; '.join(f"{kind}: {', '.join(names)}" for kind, names in kinds.items())
+        files.append(f"- `{path}` - {summary}")
+    
+    if template_type == 'fullstack':
+        files.append("- `docker-compose.yml` - Container orchestration")
+    return '\n'.join(files)
 
 def _get_code_patterns(template_type):
     """Get code patterns description."""
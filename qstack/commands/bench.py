@@ -0,0 +1,131 @@
+"""Bench commands to load-test a running QStack backend."""
+
+import json
+import asyncio
+from datetime import datetime, timezone
+import click
+from colorama import Fore, Style
+from ..core.load_generator import TRANSPORT_ERRORS, HTTPConnection, discover_endpoints, router_paths, run_load
+
+@click.group()
+def bench():
+    """Benchmark a running QStack application."""
+
+@bench.command('api')
+@click.option('--url', '-u', default='http://localhost:8000', show_default=True,
+              help='Base URL of the backend (qstack up serves it on port 8000)')
+@click.option('--concurrency', '-c', default=10, show_default=True, help='Concurrent keep-alive connections')
+@click.option('--duration', '-d', default=10.0, show_default=True, help='Seconds to run')
+@click.option('--requests', '-n', 'total', type=int, default=None, help='Stop after this many requests instead')
+@click.option('--endpoint', '-e', 'endpoints', multiple=True,
+              help='Path to request (repeatable); defaults to the router endpoints and one detail URL each')
+@click.option('--header', '-H', 'raw_headers', multiple=True, help="Extra request header, e.g. 'Authorization: Token abc'")
+@click.option('--timeout', default=10.0, show_default=True, help='Seconds before a request counts as timed out')
+@click.option('--path', '-p', default='.', help='Path to project directory (to read its router endpoints)')
+@click.option('--compare', type=click.File('r'), default=None,
+              help='Previous --json output to compare against (deltas are included in --json output)')
+@click.option('--json', 'as_json', is_flag=True, help='Output machine-readable JSON')
+def api(url, concurrency, duration, total, endpoints, raw_headers, timeout, path, compare, as_json):
+    """Drive the backend's API endpoints with an asyncio load generator."""
+    if concurrency < 1 or (total is not None and total < 1) or duration <= 0:
+        raise click.BadParameter('concurrency, duration and requests must be positive')
+    try:
+        HTTPConnection(url)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint='--url')
+    headers = {}
+    for header in raw_headers:
+        name, sep, value = header.partition(':')
+        if not sep:
+            raise click.BadParameter(f"Expected 'Name: value', got '{header}'", param_hint='--header')
+        headers[name.strip()] = value.strip()
+    try:
+        baseline = json.load(compare) if compare else None
+    except ValueError as e:
+        raise click.BadParameter(f'Not valid JSON: {e}', param_hint='--compare')
+    if baseline is not None and not isinstance(baseline, dict):
+        raise click.BadParameter('Expected the output of qstack bench api --json', param_hint='--compare')
+
+    try:
+        paths = list(endpoints) or asyncio.run(discover_endpoints(url, router_paths(path), headers=headers))
+    except TRANSPORT_ERRORS as e:
+        click.echo(f"{Fore.RED}❌ Could not reach {url}: {e}. Is the backend running (qstack up)?{Style.RESET_ALL}")
+        return
+    if not paths:
+        click.echo(f"{Fore.RED}❌ No endpoints found. Pass them with --endpoint /api/...{Style.RESET_ALL}")
+        return
+
+    if not as_json:
+        limit = f'{total} requests' if total is not None else f'{duration:g}s'
+        click.echo(f"{Fore.CYAN}🚀 Benchmarking {url}: {len(paths)} endpoints, "
+                   f"{concurrency} connections, {limit}...{Style.RESET_ALL}")
+
+    stats = asyncio.run(run_load(url, paths, concurrency=concurrency, duration=duration,
+                                 requests=total, timeout=timeout, headers=headers))
+    result = {
+        'url': url,
+        'started_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'concurrency': concurrency,
+        'duration_s': round(stats.elapsed, 3),
+        **stats.summary(),
+    }
+    if baseline:
+        result['comparison'] = _compare(result, baseline)
+
+    if as_json:
+        click.echo(json.dumps(result, indent=2))
+        return
+    _render(result)
+
+def _compare(result, baseline):
+    """Return each headline metric's baseline value, current value and relative change."""
+    def error_pct(run):
+        return None if run.get('error_rate') is None else round(run['error_rate'] * 100, 2)
+
+    metrics = [('throughput_rps', result['throughput_rps'], baseline.get('throughput_rps'))]
+    metrics += [(f'{name}_ms', result['latency_ms'][name], baseline.get('latency_ms', {}).get(name))
+                for name in ('p50', 'p95', 'p99')]
+    metrics.append(('error_pct', error_pct(result), error_pct(baseline)))
+    return {
+        'baseline_started_at': baseline.get('started_at'),
+        'metrics': [
+            {'metric': name, 'baseline': previous, 'current': current,
+             'change_pct': round((current - previous) / previous * 100, 1) if previous else None}
+            for name, current, previous in metrics
+            if current is not None and previous is not None
+        ],
+    }
+
+def _render(result):
+    """Print the per-endpoint table, the latency histogram and the comparison, if any."""
+    click.echo(f"\n{'endpoint':<40}{'reqs':>8}{'req/s':>10}{'err%':>7}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for row in [*result['endpoints'], dict(result, path='all')]:
+        latency = row['latency_ms']
+        line = (f"{row['path'][:39]:<40}{row['requests']:>8}{row['throughput_rps'] or 0:>10.1f}"
+                f"{(row['error_rate'] or 0) * 100:>6.1f}%{latency['p50'] or 0:>9.2f}"
+                f"{latency['p95'] or 0:>9.2f}{latency['p99'] or 0:>9.2f}")
+        click.echo(f"{Fore.RED}{line}{Style.RESET_ALL}" if row['error_rate'] else line)
+
+    failures = {**{f'HTTP {code}': count for code, count in result['status_codes'].items() if int(code) >= 400},
+                **result['transport_errors']}
+    if failures:
+        click.echo(f"\n{Fore.RED}❌ Errors: " + ', '.join(f'{kind} x{count}' for kind, count in failures.items())
+                   + Style.RESET_ALL)
+
+    click.echo(f"\n{Fore.CYAN}📊 Latency histogram{Style.RESET_ALL}")
+    completed = sum(bucket['count'] for bucket in result['histogram']) or 1
+    lower = 0
+    for bucket in result['histogram']:
+        label = f"{lower}-{bucket['le_ms']} ms" if bucket['le_ms'] else f'>{lower} ms'
+        lower = bucket['le_ms']
+        if not bucket['count']:
+            continue
+        share = bucket['count'] / completed
+        click.echo(f"  {label:>13} {'█' * max(1, round(share * 40)):<40} {bucket['count']:>8} {share * 100:5.1f}%")
+
+    comparison = result.get('comparison')
+    if comparison:
+        click.echo(f"\n{Fore.CYAN}🔍 Compared to {comparison['baseline_started_at'] or 'baseline'}{Style.RESET_ALL}")
+        for row in comparison['metrics']:
+            change = f"{row['change_pct']:+.1f}%" if row['change_pct'] is not None else ''
+            click.echo(f"  {row['metric']:<15}{row['baseline']:>10.2f} → {row['current']:>10.2f}  {change}")
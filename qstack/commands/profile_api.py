@@ -0,0 +1,82 @@
+"""Profile-api command to summarize per-request instrumentation logs."""
+
+import os
+import json
+import subprocess
+import click
+from colorama import Fore, Style
+from ..core.request_profile import SORT_KEYS, parse_log_lines, summarize
+from ..core.utils import detect_docker_compose
+
+@click.command()
+@click.argument('log_files', nargs=-1, type=click.File('r'))
+@click.option('--path', '-p', default='.', help='Path to project directory (used when no log file is given)')
+@click.option('--service', '-s', default='backend', show_default=True, help='Compose service to read logs from')
+@click.option('--sort', type=click.Choice(sorted(SORT_KEYS)), default='p95', show_default=True,
+              help='Column to rank endpoints by')
+@click.option('--limit', '-n', type=int, default=None, help='Show only the first N endpoints')
+@click.option('--json', 'as_json', is_flag=True, help='Output machine-readable JSON')
+def profile_api(log_files, path, service, sort, limit, as_json):
+    """Summarize API_INSTRUMENTATION logs per endpoint.
+
+    Reads LOG_FILES ('-' for stdin), or the backend's `docker compose logs`
+    when none are given.
+    """
+    if log_files:
+        entries = [entry for log_file in log_files for entry in parse_log_lines(log_file)]
+    else:
+        lines = _compose_logs(path, service)
+        if lines is None:
+            return
+        entries = list(parse_log_lines(lines))
+
+    if not entries:
+        if as_json:
+            click.echo(json.dumps([]))
+        else:
+            click.echo(f"{Fore.YELLOW}⚠️  No instrumentation entries found. "
+                       f"Is API_INSTRUMENTATION=True set for the backend?{Style.RESET_ALL}")
+        return
+
+    rows = summarize(entries, sort=sort)[:limit]
+
+    if as_json:
+        click.echo(json.dumps(rows, indent=2))
+        return
+
+    click.echo(f"{Fore.CYAN}📊 {len(entries)} requests across {len(rows)} endpoints{Style.RESET_ALL}\n")
+    click.echo(f"{'endpoint':<36}{'reqs':>6}{'4xx':>5}{'5xx':>5}{'p50 ms':>9}{'p95 ms':>9}"
+               f"{'queries':>9}{'sql ms':>9}{'bytes':>9}{'N+1':>5}")
+    for row in rows:
+        endpoint = f"{row['method']} {row['endpoint']}"
+        size = row['avg_bytes'] if row['avg_bytes'] is not None else '-'
+        line = (f"{endpoint[:35]:<36}{row['requests']:>6}{row['client_errors']:>5}{row['server_errors']:>5}"
+                f"{row['p50_ms']:>9.1f}{row['p95_ms']:>9.1f}{row['avg_queries']:>9.1f}"
+                f"{row['avg_sql_ms']:>9.1f}{size:>9}{row['n_plus_one']:>5}")
+        color = Fore.YELLOW if row['n_plus_one'] else Fore.RED if row['server_errors'] else ''
+        click.echo(f"{color}{line}{Style.RESET_ALL}" if color else line)
+
+    flagged = [row for row in rows if row['worst_repeated']]
+    if flagged:
+        click.echo(f"\n{Fore.YELLOW}🔁 Likely N+1 queries:{Style.RESET_ALL}")
+        for row in flagged:
+            repeated = row['worst_repeated']
+            click.echo(f"  {row['method']} {row['endpoint']}: {repeated['count']}x {repeated['sql'][:120]}")
+
+def _compose_logs(path, service):
+    """Return the service's `docker compose logs` lines, or None after reporting an error."""
+    if not os.path.exists(os.path.join(path, 'docker-compose.yml')):
+        click.echo(f"{Fore.RED}❌ No docker-compose.yml found. Pass a log file or --path to a QStack project.{Style.RESET_ALL}")
+        return None
+
+    compose_cmd, is_available = detect_docker_compose()
+    if not is_available:
+        click.echo(f"{Fore.RED}❌ Docker Compose not found. Pass a log file instead.{Style.RESET_ALL}")
+        return None
+
+    result = subprocess.run([*compose_cmd.split(), 'logs', '--no-color', service],
+                            cwd=path, capture_output=True, text=True)
+    if result.returncode != 0:
+        click.echo(f"{Fore.RED}❌ Error reading logs: {result.stderr.strip()}{Style.RESET_ALL}")
+        return None
+    return result.stdout.splitlines()
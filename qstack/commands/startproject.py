@@ -3,9 +3,11 @@
 import os
 import click
 from colorama import Fore, Style
-from ..core.generator import ProjectGenerator
+from ..core.generator import (ProjectGenerator, DB_POOLING_MODES, SERVER_MODES, CACHE_BACKENDS,
+                              PAGINATION_MODES, JSON_BACKENDS, db_pooling_error)
 from ..core.ai_integration import create_ai_analyzer
 from ..core.ai_generator import AIProjectGenerator
+from ..core.field_registry import FieldInferenceRegistry
 
 @click.command()
 @click.argument('project_name_or_description')
@@ -18,7 +20,20 @@ from ..core.ai_generator import AIProjectGenerator
               help='Overwrite existing directory')
 @click.option('--ai', is_flag=True,
               help='Use AI to analyze project requirements from natural language description')
-def startproject(project_name_or_description, template, database, force, ai):
+@click.option('--field-rules', multiple=True, type=click.Path(exists=True, dir_okay=False),
+              help='YAML field inference rules for AI-generated models (repeatable)')
+@click.option('--db-pooling', default='none', type=click.Choice(DB_POOLING_MODES),
+              help='Database connections: per request (none), persistent, psycopg pool, or pgbouncer')
+@click.option('--server', default='wsgi', type=click.Choice(SERVER_MODES),
+              help='Backend server: WSGI with threaded workers, or ASGI with uvicorn and async views')
+@click.option('--cache', default='none', type=click.Choice(CACHE_BACKENDS),
+              help='Cache API list/detail responses in Redis or per-process memory')
+@click.option('--pagination', default='page', type=click.Choice(PAGINATION_MODES),
+              help='List pagination: page numbers, or keyset cursors on (created_at, id)')
+@click.option('--json', 'json_backend', default='stdlib', type=click.Choice(JSON_BACKENDS),
+              help='API JSON rendering and parsing: stdlib json (DRF default) or orjson')
+def startproject(project_name_or_description, template, database, force, ai, field_rules, db_pooling, server,
+                 cache, pagination, json_backend):
     """Create a new fullstack project.
     
     PROJECT_NAME_OR_DESCRIPTION: Project name, or with --ai flag, a natural language description
@@ -68,9 +83,24 @@ def startproject(project_name_or_description, template, database, force, ai):
             
             # Generate AI-powered project
             click.echo(f"\n{Fore.MAGENTA}🤖 Generating AI-customized project...{Style.RESET_ALL}")
-            generator = AIProjectGenerator(project_name, analysis)
+            pooling_error = db_pooling_error(analysis.database_type, db_pooling, server)
+            if pooling_error:
+                # The AI picked the database, so degrade pooling instead of failing
+                db_pooling = 'persistent' if analysis.database_type == 'mysql' and server == 'wsgi' else 'none'
+                click.echo(f"{Fore.YELLOW}⚠️  {pooling_error}; using --db-pooling {db_pooling}{Style.RESET_ALL}")
+            
+            field_registry = FieldInferenceRegistry.default(field_rules)
+            generator = AIProjectGenerator(project_name, analysis, field_registry=field_registry,
+                                           db_pooling=db_pooling, server=server, cache=cache,
+                                           pagination=pagination, json_backend=json_backend)
             generator.generate()
             
+            summary = generator.emission_summary
+            click.echo(f"{Fore.CYAN}📄 AI files: {len(summary.written)} written, "
+                       f"{len(summary.skipped)} identical, {len(summary.conflicts)} kept from base template{Style.RESET_ALL}")
+            for path in summary.conflicts:
+                click.echo(f"  {Fore.YELLOW}⚠️  Kept existing {path} (AI version differs){Style.RESET_ALL}")
+            
             click.echo(f"\n{Fore.GREEN}✅ AI-powered project '{project_name}' created successfully!{Style.RESET_ALL}")
             click.echo(f"\n{Fore.CYAN}🤖 AI Features:{Style.RESET_ALL}")
             click.echo(f"  • Custom models generated based on your requirements")
@@ -96,11 +126,27 @@ def startproject(project_name_or_description, template, database, force, ai):
             click.echo(f"{Fore.RED}❌ Directory '{project_name}' already exists. Use --force to overwrite.{Style.RESET_ALL}")
             return
         
+        pooling_error = db_pooling_error(database, db_pooling, server)
+        if pooling_error:
+            click.echo(f"{Fore.RED}❌ {pooling_error}{Style.RESET_ALL}")
+            return
+        
         click.echo(f"{Fore.GREEN}🚀 Creating {template} project: {project_name}{Style.RESET_ALL}")
         click.echo(f"{Fore.CYAN}📊 Database: {database}{Style.RESET_ALL}")
+        if db_pooling != 'none':
+            click.echo(f"{Fore.CYAN}🔌 Connection pooling: {db_pooling}{Style.RESET_ALL}")
+        if server == 'asgi':
+            click.echo(f"{Fore.CYAN}⚡ Server: ASGI (uvicorn workers, async views){Style.RESET_ALL}")
+        if cache != 'none':
+            click.echo(f"{Fore.CYAN}🗄️  API cache: {cache}{Style.RESET_ALL}")
+        if pagination == 'cursor':
+            click.echo(f"{Fore.CYAN}📜 Pagination: keyset cursor on (created_at, id){Style.RESET_ALL}")
+        if json_backend == 'orjson':
+            click.echo(f"{Fore.CYAN}🧾 JSON: orjson renderer and parser{Style.RESET_ALL}")
         
         try:
-            generator = ProjectGenerator(project_name, template, database)
+            generator = ProjectGenerator(project_name, template, database, db_pooling=db_pooling, server=server,
+                                         cache=cache, pagination=pagination, json_backend=json_backend)
             generator.generate()
             
             click.echo(f"\n{Fore.GREEN}✅ Project '{project_name}' created successfully!{Style.RESET_ALL}")
@@ -1,54 +1,153 @@
 """Status command to show project progress."""
 
 import os
+import json
 import click
 from colorama import Fore, Style
-from ..core.status_parser import StatusParser
+from ..core.status_parser import StatusParser, SectionIndex
+from ..core.status_aggregator import aggregate_status
+from ..core.watcher import watch_file
 
 @click.command()
 @click.option('--path', '-p', default='.', help='Path to project directory')
-def status(path):
+@click.option('--json', 'as_json', is_flag=True, help='Output machine-readable JSON')
+@click.option('--no-cache', is_flag=True, help='Ignore the cached status and re-parse the scope file')
+@click.option('--watch', '-w', is_flag=True, help='Keep running and re-render when the scope file changes')
+@click.option('--interval', default=1.0, show_default=True,
+              help='Polling interval in seconds when inotify (watchdog) is unavailable')
+@click.option('--recursive', '-r', 'recursive_root', type=click.Path(exists=True, file_okay=False),
+              help='Aggregate status for every QStack project under this root')
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=None,
+              help='Worker processes for --recursive (default: CPU count)')
+def status(path, as_json, no_cache, watch, interval, recursive_root, jobs):
     """Show project status and progress tracking."""
-    
+
+    if recursive_root:
+        _show_aggregate_status(recursive_root, as_json, jobs, use_cache=not no_cache)
+        return
+
     if not os.path.exists(path):
-        click.echo(f"{Fore.RED}❌ Directory '{path}' does not exist{Style.RESET_ALL}")
+        _report_error(f"Directory '{path}' does not exist", as_json, Fore.RED, "❌")
         return
-        
+
     scope_file = os.path.join(path, 'defineprojectscope.md')
-    
+
     if not os.path.exists(scope_file):
-        click.echo(f"{Fore.YELLOW}⚠️  No defineprojectscope.md found. This might not be a QStack project.{Style.RESET_ALL}")
+        _report_error("No defineprojectscope.md found. This might not be a QStack project.",
+                      as_json, Fore.YELLOW, "⚠️ ")
         return
-    
+
     try:
         parser = StatusParser(scope_file)
-        progress = parser.get_progress()
-        
-        click.echo(f"{Fore.CYAN}📊 Project Status{Style.RESET_ALL}")
-        click.echo(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-        
-        total_features = len(progress['features'])
-        completed = sum(1 for f in progress['features'] if f['completed'])
-        
-        click.echo(f"Progress: {completed}/{total_features} features completed")
-        
-        if total_features > 0:
-            percentage = completed/total_features*100
-            click.echo(f"Completion: {Fore.GREEN}{percentage:.1f}%{Style.RESET_ALL}\n")
-        else:
-            click.echo(f"Completion: {Fore.YELLOW}No tracked features{Style.RESET_ALL}\n")
-        
-        for feature in progress['features']:
-            status_icon = "✅" if feature['completed'] else "⏳"
-            color = Fore.GREEN if feature['completed'] else Fore.YELLOW
-            click.echo(f"{status_icon} {color}{feature['name']}{Style.RESET_ALL}")
-            if feature['description']:
-                click.echo(f"   {feature['description']}")
-        
-        if progress['next_steps']:
-            click.echo(f"\n{Fore.CYAN}🎯 Next Steps:{Style.RESET_ALL}")
-            for step in progress['next_steps']:
-                click.echo(f"  • {step}")
-                
+        progress = parser.get_progress(use_cache=not no_cache)
+        _render_progress(progress, as_json, watching=watch)
+
+        if watch:
+            _watch_progress(parser, scope_file, as_json, interval)
+
+    except KeyboardInterrupt:
+        pass
     except Exception as e:
-        click.echo(f"{Fore.RED}❌ Error reading project status: {str(e)}{Style.RESET_ALL}")
\ No newline at end of file
+        _report_error(f"Error reading project status: {str(e)}", as_json, Fore.RED, "❌")
+
+def _watch_progress(parser, scope_file, as_json, interval):
+    """Re-render progress whenever the scope file changes."""
+    index = SectionIndex(parser)
+    with open(scope_file, 'r') as f:
+        index.update(f.read())
+
+    for _ in watch_file(scope_file, interval=interval):
+        try:
+            with open(scope_file, 'r') as f:
+                progress, _ = index.update(f.read())
+        except FileNotFoundError:
+            continue
+        _render_progress(progress, as_json, watching=True)
+
+def _render_progress(progress, as_json, watching=False):
+    """Print progress as colored text or JSON."""
+    total_features = len(progress['features'])
+    completed = sum(1 for f in progress['features'] if f['completed'])
+
+    if as_json:
+        click.echo(json.dumps({
+            'completed': completed,
+            'total': total_features,
+            'percentage': round(completed / total_features * 100, 1) if total_features else None,
+            'features': progress['features'],
+            'next_steps': progress['next_steps']
+        }, indent=None if watching else 2, ensure_ascii=False))
+        return
+
+    if watching:
+        click.clear()
+
+    click.echo(f"{Fore.CYAN}📊 Project Status{Style.RESET_ALL}")
+    click.echo(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+
+    click.echo(f"Progress: {completed}/{total_features} features completed")
+
+    if total_features > 0:
+        percentage = completed/total_features*100
+        click.echo(f"Completion: {Fore.GREEN}{percentage:.1f}%{Style.RESET_ALL}\n")
+    else:
+        click.echo(f"Completion: {Fore.YELLOW}No tracked features{Style.RESET_ALL}\n")
+
+    for feature in progress['features']:
+        status_icon = "✅" if feature['completed'] else "⏳"
+        color = Fore.GREEN if feature['completed'] else Fore.YELLOW
+        click.echo(f"{status_icon} {color}{feature['name']}{Style.RESET_ALL}")
+        if feature['description']:
+            click.echo(f"   {feature['description']}")
+
+    if progress['next_steps']:
+        click.echo(f"\n{Fore.CYAN}🎯 Next Steps:{Style.RESET_ALL}")
+        for step in progress['next_steps']:
+            click.echo(f"  • {step}")
+
+    if watching:
+        click.echo(f"\n{Fore.BLUE}👀 Watching defineprojectscope.md for changes (Ctrl+C to stop){Style.RESET_ALL}")
+
+def _show_aggregate_status(root, as_json, jobs, use_cache=True):
+    """Print per-project and total completion for a monorepo."""
+    summary = aggregate_status(root, jobs=jobs, use_cache=use_cache)
+
+    if as_json:
+        click.echo(json.dumps(summary, indent=2))
+        return
+
+    if not summary['projects']:
+        click.echo(f"{Fore.YELLOW}⚠️  No QStack projects found under '{root}'{Style.RESET_ALL}")
+        return
+
+    total_label = f"Total ({summary['totals']['projects']} projects)"
+    width = max(len(total_label), *(len(row['path']) for row in summary['projects']))
+    click.echo(f"{Fore.CYAN}📊 Monorepo Status{Style.RESET_ALL}")
+    click.echo(f"{'Project':<{width}}  {'Done':>11}  {'Completion':>10}")
+    click.echo("━" * (width + 25))
+
+    for row in summary['projects']:
+        if row.get('error'):
+            click.echo(f"{row['path']:<{width}}  {Fore.RED}❌ {row['error']}{Style.RESET_ALL}")
+            continue
+        _echo_status_row(row['path'], row, width)
+
+    click.echo("━" * (width + 25))
+    _echo_status_row(total_label, summary['totals'], width)
+
+def _echo_status_row(label, row, width):
+    """Print one aligned row of the aggregate status table."""
+    done = f"{row['completed']}/{row['total']}"
+    if row['percentage'] is None:
+        completion = f"{Fore.YELLOW}{'n/a':>10}{Style.RESET_ALL}"
+    else:
+        color = Fore.GREEN if row['percentage'] == 100 else Fore.YELLOW
+        completion = f"{color}{row['percentage']:>9.1f}%{Style.RESET_ALL}"
+    click.echo(f"{label:<{width}}  {done:>11}  {completion}")
+
+def _report_error(message, as_json, color, icon):
+    """Report an error as colored text or as a JSON object."""
+    if as_json:
+        click.echo(json.dumps({'error': message}))
+    else:
+        click.echo(f"{color}{icon} {message}{Style.RESET_ALL}")
@@ -1,24 +1,45 @@
 """AI-powered project generator that creates custom projects based on Claude analysis."""
 
 import os
+import re
 import json
-from typing import Dict, Any
-from jinja2 import Environment, FileSystemLoader
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
 from .ai_integration import AIProjectAnalysis, ProjectFeature
-from .generator import ProjectGenerator
+from .field_registry import FieldInferenceRegistry
+from .generator import PARTIAL_INDEX_DATABASES, ProjectGenerator
+
+# Route prefix and URL-name basename the todos app already uses under /api/
+RESERVED_ROUTES = {'todos'}
+RESERVED_BASENAMES = {'todo'}
+
+
+@dataclass
+class EmissionSummary:
+    """Outcome of writing AI-generated files."""
+    written: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    conflicts: List[str] = field(default_factory=list)
 
 
 class AIProjectGenerator(ProjectGenerator):
     """Extended project generator with AI-powered customization."""
     
-    def __init__(self, project_name: str, ai_analysis: AIProjectAnalysis):
-        # Use analysis results for configuration
+    def __init__(self, project_name: str, ai_analysis: AIProjectAnalysis,
+                 field_registry: Optional[FieldInferenceRegistry] = None, **options):
+        # Use analysis results for configuration; remaining options (e.g.
+        # db_pooling, server, cache, pagination, json_backend) pass straight through to the base generator
         super().__init__(
             project_name=project_name,
             template_type=ai_analysis.template_type,
-            database=ai_analysis.database_type
+            database=ai_analysis.database_type,
+            **options
         )
         self.ai_analysis = ai_analysis
+        self.emission_summary = EmissionSummary()
+        self.field_registry = field_registry or FieldInferenceRegistry.default()
         self.custom_models = self._extract_models()
         self.custom_components = self._extract_components()
         self.additional_packages = ai_analysis.additional_packages
@@ -29,11 +50,9 @@ class AIProjectGenerator(ProjectGenerator):
         super().generate()
         
         # Then apply AI customizations
-        self._generate_custom_models()
-        self._generate_custom_components()
+        self.emission_summary = self._write_planned_files(self._plan_custom_files())
         self._update_package_dependencies()
         self._generate_ai_documentation()
-        self._update_urls_and_views()
     
     def _generate_ai_context(self, project_path, context):
         """Override parent method to include AI-specific context."""
@@ -60,23 +79,129 @@ class AIProjectGenerator(ProjectGenerator):
     def _extract_models(self) -> Dict[str, Dict]:
         """Extract Django models from AI analysis."""
         models = {}
+        routes = set(RESERVED_ROUTES)
         
         for feature in self.ai_analysis.features:
             for model_name in feature.models:
+                if model_name in models:
+                    continue
+                inferred = self.field_registry.infer(model_name, feature.name)
+                route = self._route_name(model_name, feature.name, routes)
+                routes.add(route)
                 models[model_name] = {
                     'feature': feature.name,
-                    'fields': self._generate_model_fields(model_name, feature),
-                    'description': f"Model for {feature.description}"
+                    'fields': inferred['fields'],
+                    'indexes': self._plan_indexes(model_name, inferred['fields'], inferred['indexes']),
+                    'foreign_keys': inferred['foreign_keys'],
+                    'description': f"Model for {feature.description}",
+                    'route': route,
+                    # Reverse names (<basename>-list) must not clash with the todos app's
+                    'basename': route if model_name.lower() in RESERVED_BASENAMES else None,
                 }
         
+        self._annotate_relations(models)
         return models
     
+    def _annotate_relations(self, models: Dict[str, Dict]):
+        """Derive select_related/prefetch_related lookups from FK hints.
+
+        Only forward relations are listed: the `fields='__all__'` serializers
+        render a model's own foreign keys and many-to-many ids, never reverse
+        relations, so loading those would only add queries.
+        """
+        for model in models.values():
+            many = {name for name in model['foreign_keys']
+                    if 'ManyToManyField(' in model['fields'].get(name, '')}
+            model['select_related'] = sorted(set(model['foreign_keys']) - many)
+            model['prefetch_related'] = sorted(many)
+    
+    def _plan_indexes(self, model_name: str, fields: Dict[str, str], indexes: List[Dict]) -> List[Dict]:
+        """Complete a rule's indexes with those the generated list queries need.
+
+        Adds an index for the default ordering, a (field, -created_at)
+        composite for boolean flags and foreign keys, and a single-column
+        index for choice and date fields, unless a rule index already starts
+        with (or, when partial, filters on) that field. Django indexes bare
+        FK columns itself, so foreign keys only get the composite.
+        On databases without partial indexes, a rule's partial index becomes
+        a plain composite led by its condition fields.
+        """
+        if self.database not in PARTIAL_INDEX_DATABASES:
+            indexes = [{**index, 'fields': [*sorted(index['condition']), *index['fields']], 'condition': {}}
+                       if index['condition'] else index for index in indexes]
+        
+        covered = set()
+        for index in indexes:
+            covered.add(index['fields'][0].lstrip('-'))
+            covered.update(index['condition'])
+        
+        if self.pagination == 'cursor':
+            planned = indexes + [{'fields': ['-created_at', '-id'], 'condition': {},
+                                  'comment': "Serves keyset pagination's ORDER BY and cursor seek"}]
+        else:
+            planned = indexes + [{'fields': ['-created_at'], 'condition': {},
+                                  'comment': 'Serves the default ordering'}]
+        
+        for field_name, definition in fields.items():
+            if field_name in covered or 'unique=True' in definition:
+                continue
+            if 'BooleanField(' in definition or 'ForeignKey(' in definition:
+                planned.append({'fields': [field_name, '-created_at'], 'condition': {}})
+            elif 'choices=' in definition or (re.search(r'\bDate(Time)?Field\(', definition)
+                                               and 'auto_now' not in definition):
+                planned.append({'fields': [field_name], 'condition': {}})
+        
+        unique = {}
+        for index in planned:
+            key = (tuple(index['fields']), tuple(sorted(index['condition'].items())))
+            unique.setdefault(key, self._render_index(model_name, index))
+        return list(unique.values())
+    
+    def _render_index(self, model_name: str, index: Dict) -> Dict:
+        """Turn an index spec into template values; partial indexes need a name."""
+        rendered = {'fields': index['fields'], 'condition': '', 'name': None, 'comment': index.get('comment')}
+        if index['condition']:
+            rendered['condition'] = ', '.join(
+                f'{name}={json.dumps(value) if isinstance(value, str) else value!r}'
+                for name, value in sorted(index['condition'].items())
+            )
+            digest = hashlib.md5(f"{model_name}|{index['fields']}|{rendered['condition']}".encode()).hexdigest()
+            # Django caps index names at 30 characters
+            rendered['name'] = f"{model_name.lower()[:11]}_{index['fields'][0].lstrip('-')[:7]}_{digest[:6]}_idx"
+        return rendered
+    
+    def _route_name(self, model_name: str, feature_name: str = '', taken=()) -> str:
+        """Convert a model name to a kebab-case plural API route not in `taken`.
+
+        A clash (e.g. an AI `Todo` model next to the todos app) is prefixed
+        with the feature name, then numbered.
+        """
+        route = re.sub(r'(?<!^)(?=[A-Z])', '-', model_name).lower()
+        if route.endswith('y') and route[-2:-1] not in 'aeiou':
+            route = route[:-1] + 'ies'
+        elif route.endswith(('s', 'x', 'ch', 'sh')):
+            route += 'es'
+        else:
+            route += 's'
+        if route not in taken:
+            return route
+        
+        feature = re.sub(r'[^a-z0-9]+', '-', feature_name.lower()).strip('-')
+        candidate = f'{feature}-{route}' if feature else route
+        number = 2
+        while candidate in taken:
+            candidate = f'{feature}-{route}-{number}' if feature else f'{route}-{number}'
+            number += 1
+        return candidate
+    
     def _extract_components(self) -> Dict[str, Dict]:
         """Extract React components from AI analysis."""
         components = {}
         
         for feature in self.ai_analysis.features:
             for component_name in feature.components:
+                if component_name in components:
+                    continue
                 components[component_name] = {
                     'feature': feature.name,
                     'description': f"Component for {feature.description}",
@@ -85,58 +210,6 @@ class AIProjectGenerator(ProjectGenerator):
         
         return components
     
-    def _generate_model_fields(self, model_name: str, feature: ProjectFeature) -> Dict[str, str]:
-        """Generate Django model fields based on model name and feature."""
-        common_fields = {
-            'created_at': 'models.DateTimeField(auto_now_add=True)',
-            'updated_at': 'models.DateTimeField(auto_now=True)'
-        }
-        
-        # Smart field generation based on model name
-        fields = common_fields.copy()
-        
-        if 'User' in model_name:
-            fields.update({
-                'username': 'models.CharField(max_length=150, unique=True)',
-                'email': 'models.EmailField(unique=True)',
-                'first_name': 'models.CharField(max_length=30)',
-                'last_name': 'models.CharField(max_length=30)',
-                'is_active': 'models.BooleanField(default=True)'
-            })
-        
-        elif 'Todo' in model_name or 'Task' in model_name:
-            fields.update({
-                'title': 'models.CharField(max_length=200)',
-                'description': 'models.TextField(blank=True)',
-                'is_completed': 'models.BooleanField(default=False)',
-                'due_date': 'models.DateTimeField(null=True, blank=True)',
-                'priority': 'models.CharField(max_length=10, choices=[(\"low\", \"Low\"), (\"medium\", \"Medium\"), (\"high\", \"High\")], default=\"medium\")'
-            })
-        
-        elif 'Category' in model_name:
-            fields.update({
-                'name': 'models.CharField(max_length=100)',
-                'color': 'models.CharField(max_length=7, default=\"#007bff\")',
-                'description': 'models.TextField(blank=True)'
-            })
-        
-        elif 'Profile' in model_name:
-            fields.update({
-                'user': 'models.OneToOneField(User, on_delete=models.CASCADE)',
-                'bio': 'models.TextField(max_length=500, blank=True)',
-                'avatar': 'models.ImageField(upload_to=\"avatars/\", blank=True)',
-                'phone': 'models.CharField(max_length=20, blank=True)'
-            })
-        
-        else:
-            # Generic fields for unknown models
-            fields.update({
-                'name': 'models.CharField(max_length=100)',
-                'description': 'models.TextField(blank=True)'
-            })
-        
-        return fields
-    
     def _generate_component_props(self, component_name: str, feature: ProjectFeature) -> Dict[str, str]:
         """Generate React component props based on component name."""
         props = {}
@@ -162,102 +235,133 @@ class AIProjectGenerator(ProjectGenerator):
         
         return props
     
-    def _generate_custom_models(self):
-        """Generate custom Django models based on AI analysis."""
-        if not self.custom_models:
-            return
+    def _backend_dir(self) -> Optional[str]:
+        """Return the backend root for the current template type."""
+        if self.template_type == 'frontend-only':
+            return None
+        if self.template_type == 'api-only':
+            return self.project_name
+        return os.path.join(self.project_name, 'backend')
+    
+    def _frontend_dir(self) -> Optional[str]:
+        """Return the frontend root for the current template type."""
+        if self.template_type == 'api-only':
+            return None
+        if self.template_type == 'frontend-only':
+            return self.project_name
+        return os.path.join(self.project_name, 'frontend')
+    
+    def _plan_custom_files(self) -> Dict[str, str]:
+        """Build the full set of AI-generated files (path -> content) up front."""
+        plan = {}
+        plan.update(self._plan_custom_models())
+        plan.update(self._plan_custom_api())
+        plan.update(self._plan_custom_components())
+        return plan
+    
+    def _build_context(self):
+        """Add the AI app and its requirements to the base template context."""
+        context = super()._build_context()
+        if self.custom_models and self._backend_dir() is not None:
+            context['extra_apps'] = [self.project_name.replace('-', '_')]
+            if any('ImageField' in definition
+                   for model in self.custom_models.values()
+                   for definition in model['fields'].values()):
+                context['extra_requirements'] = ['Pillow==10.3.0']
+        return context
+    
+    def _plan_custom_models(self) -> Dict[str, str]:
+        """Plan the custom Django models file based on AI analysis."""
+        backend_dir = self._backend_dir()
+        if not self.custom_models or backend_dir is None:
+            return {}
         
-        # Create custom models.py
-        models_content = self._create_models_file()
         project_name_snake = self.project_name.replace('-', '_')
-        models_path = os.path.join(self.project_name, 'backend', f'{project_name_snake}', 'models.py')
+        models_path = os.path.join(backend_dir, project_name_snake, 'models.py')
+        return {models_path: self._create_models_file()}
+    
+    def _plan_custom_api(self) -> Dict[str, str]:
+        """Plan the Django app files exposing custom models over DRF."""
+        backend_dir = self._backend_dir()
+        if not self.custom_models or backend_dir is None:
+            return {}
         
-        with open(models_path, 'w') as f:
-            f.write(models_content)
+        app_name = self.project_name.replace('-', '_')
+        app_dir = os.path.join(backend_dir, app_name)
+        context = {
+            'app_name': app_name,
+            'app_config': f'{self._to_pascal_case(app_name)}Config',
+            'models': self.custom_models,
+            'server': self.server,
+            'cache': self.cache,
+            'pagination': self.pagination,
+        }
+        
+        plan = {os.path.join(app_dir, '__init__.py'): ''}
+        for filename in ('apps.py', 'serializers.py', 'views.py', 'urls.py', 'tests.py'):
+            template = self.env.get_template(f'ai/{filename}.j2')
+            plan[os.path.join(app_dir, filename)] = template.render(**context)
+        return plan
     
     def _create_models_file(self) -> str:
         """Create the models.py file content."""
-        content = '''"""Custom models generated by QStack AI."""
-
-from django.db import models
-from django.contrib.auth.models import User
-
-
-'''
-        
-        for model_name, model_data in self.custom_models.items():
-            content += f'class {model_name}(models.Model):\n'
-            content += f'    """Model for {model_data["description"]}."""\n'
-            
-            for field_name, field_definition in model_data['fields'].items():
-                content += f'    {field_name} = {field_definition}\n'
-            
-            content += f'\n    class Meta:\n'
-            content += f'        verbose_name = "{model_name}"\n'
-            content += f'        verbose_name_plural = "{model_name}s"\n'
-            content += f'        ordering = ["-created_at"]\n\n'
-            content += f'    def __str__(self):\n'
-            
-            # Smart __str__ method
-            if 'name' in model_data['fields']:
-                content += f'        return self.name\n'
-            elif 'title' in model_data['fields']:
-                content += f'        return self.title\n'
-            elif 'username' in model_data['fields']:
-                content += f'        return self.username\n'
-            else:
-                content += f'        return f"{model_name} {{self.id}}"\n'
-            
-            content += '\n\n'
-        
-        return content
+        template = self.env.get_template('ai/models.py.j2')
+        return template.render(models=self.custom_models, pagination=self.pagination)
     
-    def _generate_custom_components(self):
-        """Generate custom React components based on AI analysis."""
-        if not self.custom_components:
-            return
+    def _plan_custom_components(self) -> Dict[str, str]:
+        """Plan custom React component files based on AI analysis."""
+        frontend_dir = self._frontend_dir()
+        if not self.custom_components or frontend_dir is None:
+            return {}
         
-        components_dir = os.path.join(self.project_name, 'frontend', 'src', 'components')
-        
-        for component_name, component_data in self.custom_components.items():
-            component_content = self._create_component_file(component_name, component_data)
-            component_path = os.path.join(components_dir, f'{component_name}.jsx')
-            
-            with open(component_path, 'w') as f:
-                f.write(component_content)
+        components_dir = os.path.join(frontend_dir, 'src', 'components')
+        return {
+            os.path.join(components_dir, f'{component_name}.jsx'):
+                self._create_component_file(component_name, component_data)
+            for component_name, component_data in self.custom_components.items()
+        }
     
     def _create_component_file(self, component_name: str, component_data: Dict) -> str:
         """Create React component file content."""
-        props_str = ', '.join(component_data.get('props', {}).keys())
+        template = self.env.get_template('ai/component.jsx.j2')
+        return template.render(component_name=component_name, component=component_data)
+    
+    def _write_planned_files(self, plan: Dict[str, str]) -> EmissionSummary:
+        """Write planned files concurrently without clobbering base-template files."""
+        summary = EmissionSummary()
+        if not plan:
+            return summary
         
-        content = f'''import React from 'react';
-
-/**
- * {component_name} - {component_data['description']}
- * Generated by QStack AI
- */
-const {component_name} = ({{ {props_str} }}) => {{
-    return (
-        <div className="p-4 bg-white rounded-lg shadow">
-            <h2 className="text-xl font-semibold mb-4">{component_name}</h2>
-            <p className="text-gray-600">
-                {component_data['description']}
-            </p>
-            {{/* TODO: Implement {component_name} functionality */}}
-        </div>
-    );
-}};
-
-export default {component_name};
-'''
-        return content
+        # Create directories serially so workers only ever write files
+        for directory in sorted({os.path.dirname(path) for path in plan}):
+            os.makedirs(directory, exist_ok=True)
+        
+        with ThreadPoolExecutor() as pool:
+            results = pool.map(lambda item: (item[0], self._write_planned_file(*item)), plan.items())
+            for path, outcome in sorted(results):
+                getattr(summary, outcome).append(path)
+        
+        return summary
+    
+    def _write_planned_file(self, path: str, content: str) -> str:
+        """Write one planned file, returning 'written', 'skipped' or 'conflicts'."""
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                existing = f.read()
+            # Files already on disk come from the base template: keep them
+            return 'skipped' if existing == content else 'conflicts'
+        
+        with open(path, 'w') as f:
+            f.write(content)
+        return 'written'
     
     def _update_package_dependencies(self):
         """Update package.json with additional AI-suggested packages."""
-        if not self.additional_packages:
+        frontend_dir = self._frontend_dir()
+        if not self.additional_packages or frontend_dir is None:
             return
         
-        package_json_path = os.path.join(self.project_name, 'frontend', 'package.json')
+        package_json_path = os.path.join(frontend_dir, 'package.json')
         
         try:
             with open(package_json_path, 'r') as f:
@@ -277,57 +381,11 @@ export default {component_name};
     
     def _generate_ai_documentation(self):
         """Generate AI-specific documentation."""
-        ai_doc_content = f"""# AI-Generated Project: {self.project_name}
-
-## Project Description
-{self.ai_analysis.description}
-
-## AI-Detected Features
-
-"""
-        
-        for feature in self.ai_analysis.features:
-            ai_doc_content += f"""### {feature.name.replace('_', ' ').title()}
-**Description:** {feature.description}
-
-**Models:** {', '.join(feature.models) if feature.models else 'None'}
-
-**Components:** {', '.join(feature.components) if feature.components else 'None'}
-
-**API Endpoints:** {', '.join(feature.api_endpoints) if feature.api_endpoints else 'None'}
-
-**Dependencies:** {', '.join(feature.dependencies) if feature.dependencies else 'None'}
-
----
-
-"""
-        
-        ai_doc_content += f"""
-## Implementation Notes
-
-This project was generated using QStack AI with Claude analysis. The structure and features were automatically detected from your natural language description.
-
-### Next Steps
-1. Review the generated models in `backend/{self.project_name.replace('-', '_')}/models.py`
-2. Check the React components in `frontend/src/components/`
-3. Run migrations: `docker-compose exec backend python manage.py makemigrations`
-4. Run migrations: `docker-compose exec backend python manage.py migrate`
-5. Customize the generated code as needed
-
-### AI Analysis Results
-- **Template Type:** {self.ai_analysis.template_type}
-- **Database:** {self.ai_analysis.database_type}
-- **Additional Packages:** {', '.join(self.ai_analysis.additional_packages) if self.ai_analysis.additional_packages else 'None'}
-
-Generated with ❤️ by QStack AI - Powered by Claude
-"""
+        context = {
+            'project_name': self.project_name,
+            'project_name_snake': self.project_name.replace('-', '_'),
+            'ai_analysis': self.ai_analysis,
+        }
         
         ai_doc_path = os.path.join(self.project_name, 'AI_ANALYSIS.md')
-        with open(ai_doc_path, 'w') as f:
-            f.write(ai_doc_content)
-    
-    def _update_urls_and_views(self):
-        """Generate basic API views and URLs for detected features."""
-        # This would generate Django REST framework views and URLs
-        # For now, just create a placeholder
-        pass
\ No newline at end of file
+        self._render_template('ai/AI_ANALYSIS.md.j2', ai_doc_path, context)
@@ -233,8 +233,26 @@ Be intelligent and creative. If the description is vague, make reasonable assump
 
 
 def create_ai_analyzer() -> Optional[ClaudeAnalyzer]:
-    """Factory function to create Claude analyzer if API key is available."""
+    """Factory function to create Claude analyzer if API key is available.
+
+    QSTACK_AI_REPLAY=<dir> serves recorded responses offline (with optional
+    QSTACK_AI_REPLAY_LATENCY and QSTACK_AI_REPLAY_ERROR_RATE), and
+    QSTACK_AI_RECORD=<dir> records live responses into fixtures.
+    """
+    from .ai_replay import RecordingClaudeAnalyzer, ReplayClaudeAnalyzer
+
+    replay_dir = os.getenv('QSTACK_AI_REPLAY')
+    if replay_dir:
+        return ReplayClaudeAnalyzer(
+            replay_dir,
+            latency=float(os.getenv('QSTACK_AI_REPLAY_LATENCY', '0')),
+            error_rate=float(os.getenv('QSTACK_AI_REPLAY_ERROR_RATE', '0'))
+        )
+
     try:
+        record_dir = os.getenv('QSTACK_AI_RECORD')
+        if record_dir:
+            return RecordingClaudeAnalyzer(record_dir)
         return ClaudeAnalyzer()
     except ValueError:
         return None
\ No newline at end of file
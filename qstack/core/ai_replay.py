@@ -0,0 +1,82 @@
+"""Record and replay Claude API responses for offline AI generation."""
+
+import json
+import time
+import random
+import hashlib
+from pathlib import Path
+from typing import Optional
+
+import requests
+
+from .ai_integration import ClaudeAnalyzer
+
+
+def fixture_key(prompt: str) -> str:
+    """Return the stable fixture key for a prompt."""
+    return hashlib.sha256(prompt.encode('utf-8')).hexdigest()[:16]
+
+
+def fixture_path(fixtures_dir, prompt: str) -> Path:
+    """Return the fixture file path used for a prompt."""
+    return Path(fixtures_dir) / f'{fixture_key(prompt)}.json'
+
+
+def write_fixture(fixtures_dir, prompt: str, response: str) -> Path:
+    """Store a Claude response so it can be replayed later."""
+    path = fixture_path(fixtures_dir, prompt)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path, 'w') as f:
+        json.dump({'prompt': prompt, 'response': response}, f, indent=2)
+
+    return path
+
+
+class RecordingClaudeAnalyzer(ClaudeAnalyzer):
+    """Claude analyzer that saves every live API response as a fixture."""
+
+    def __init__(self, fixtures_dir, api_key: Optional[str] = None):
+        super().__init__(api_key=api_key)
+        self.fixtures_dir = Path(fixtures_dir)
+
+    def _call_claude_api(self, prompt: str) -> str:
+        """Call Claude and record the response."""
+        response = super()._call_claude_api(prompt)
+        write_fixture(self.fixtures_dir, prompt, response)
+        return response
+
+
+class ReplayClaudeAnalyzer(ClaudeAnalyzer):
+    """Claude analyzer that serves recorded responses without network access.
+
+    Latency and failures can be injected to exercise timing and the
+    fallback analysis deterministically.
+    """
+
+    def __init__(self, fixtures_dir, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, seed: Optional[int] = None):
+        super().__init__(api_key='replay')
+        self.fixtures_dir = Path(fixtures_dir)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+
+    def _call_claude_api(self, prompt: str) -> str:
+        """Return the recorded response for the prompt."""
+        delay = self.latency
+        if self.jitter:
+            delay += self._random.uniform(0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+        if self.error_rate and self._random.random() < self.error_rate:
+            raise requests.exceptions.ConnectionError("Injected replay error")
+
+        path = fixture_path(self.fixtures_dir, prompt)
+        if not path.exists():
+            raise FileNotFoundError(f"No replay fixture for prompt: {path.name}")
+
+        with open(path) as f:
+            return json.load(f)['response']
@@ -0,0 +1,307 @@
+"""Index a generated project's code with `ast` for the AI context."""
+
+import os
+import re
+import ast
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .utils import PRUNED_DIRS, atomic_write
+
+INDEX_VERSION = 1
+
+# Below this many changed files a process pool costs more than it saves
+PARALLEL_THRESHOLD = 256
+
+FIELD_SUFFIXES = ('Field', 'ForeignKey', 'ManyToManyField')
+VIEW_SUFFIXES = ('ViewSet', 'APIView', 'View')
+
+COMPONENT_DEF_RE = re.compile(
+    r'^(?:export\s+default\s+)?(?:function\s+([A-Z]\w*)|const\s+([A-Z]\w*)\s*=)', re.MULTILINE)
+COMPONENT_DOC_RE = re.compile(r'/\*\*\s*\n?\s*\*?\s*(?:\w+\s+-\s+)?(.+?)\s*\n')
+
+
+def _dotted_name(node):
+    """Return 'models.Model' for an Attribute/Name chain, else ''."""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if isinstance(node, ast.Name):
+        parts.append(node.id)
+        return '.'.join(reversed(parts))
+    return ''
+
+
+def _root_name(node):
+    """Return the leftmost name of `X.objects.filter(...)`-style expressions."""
+    while isinstance(node, (ast.Attribute, ast.Call, ast.Subscript)):
+        node = node.func if isinstance(node, ast.Call) else node.value
+    return node.id if isinstance(node, ast.Name) else None
+
+
+def _string_arg(call, position=0):
+    """Return a positional string-literal argument of a call, if any."""
+    if len(call.args) > position:
+        arg = call.args[position]
+        if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+            return arg.value
+    return None
+
+
+def parse_python_source(source):
+    """Extract models, ViewSets and URL routes from Python source.
+
+    Models are classes deriving from `Model`; their fields are class-level
+    assignments of `*Field`/`ForeignKey` calls. ViewSets are classes deriving
+    from `*ViewSet`/`*View`. Routes come from `router.register(prefix, View)`
+    and `path(route, include('module'))` calls.
+    """
+    tree = ast.parse(source)
+    lines = source.splitlines()
+    facts = {'models': [], 'viewsets': [], 'registrations': [], 'includes': []}
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            bases = [_dotted_name(base).rsplit('.', 1)[-1] for base in node.bases]
+            if 'Model' in bases:
+                facts['models'].append(_model_facts(node, lines))
+            elif any(base.endswith(VIEW_SUFFIXES) for base in bases):
+                facts['viewsets'].append(_viewset_facts(node, bases))
+
+        elif isinstance(node, ast.Call):
+            func = _dotted_name(node.func)
+            if func.endswith('.register') and len(node.args) >= 2:
+                prefix = _string_arg(node)
+                if prefix is not None:
+                    view = _dotted_name(node.args[1]).rsplit('.', 1)[-1]
+                    facts['registrations'].append({'prefix': prefix, 'viewset': view})
+            elif func.rsplit('.', 1)[-1] in ('path', 're_path') and len(node.args) >= 2:
+                route = _string_arg(node)
+                target = node.args[1]
+                if (route is not None and isinstance(target, ast.Call)
+                        and _dotted_name(target.func).rsplit('.', 1)[-1] == 'include'):
+                    module = _string_arg(target)
+                    if module is not None:
+                        facts['includes'].append({'route': route, 'module': module})
+
+    return facts
+
+
+def _source_segment(lines, node):
+    """Return a node's source text from pre-split lines.
+
+    Like `ast.get_source_segment`, which re-splits the whole source on
+    every call and makes large model files quadratic.
+    """
+    first, last = node.lineno - 1, node.end_lineno - 1
+    if first == last:
+        return lines[first][node.col_offset:node.end_col_offset]
+    return '\n'.join([lines[first][node.col_offset:], *lines[first + 1:last],
+                      lines[last][:node.end_col_offset]])
+
+
+def _model_facts(node, lines):
+    """Collect the fields of a model class body."""
+    fields = {}
+    for statement in node.body:
+        if not (isinstance(statement, ast.Assign) and len(statement.targets) == 1
+                and isinstance(statement.targets[0], ast.Name)
+                and isinstance(statement.value, ast.Call)):
+            continue
+        field_type = _dotted_name(statement.value.func).rsplit('.', 1)[-1]
+        if field_type.endswith(FIELD_SUFFIXES):
+            segment = _source_segment(lines, statement.value)
+            fields[statement.targets[0].id] = ' '.join(segment.replace('models.', '').split())
+    return {'name': node.name, 'fields': fields}
+
+
+def _viewset_facts(node, bases):
+    """Collect the model and serializer a ViewSet is wired to."""
+    model = serializer = None
+    for statement in node.body:
+        if isinstance(statement, ast.Assign) and len(statement.targets) == 1:
+            target = statement.targets[0]
+            if isinstance(target, ast.Name) and target.id == 'queryset':
+                model = _root_name(statement.value)
+            elif isinstance(target, ast.Name) and target.id == 'serializer_class':
+                serializer = _dotted_name(statement.value) or None
+    return {'name': node.name, 'base': bases[0] if bases else None,
+            'model': model, 'serializer': serializer}
+
+
+def parse_component_source(name, source):
+    """Describe a React component from its JSDoc block or definition."""
+    match = COMPONENT_DOC_RE.search(source)
+    description = match.group(1) if match else ''
+    definition = COMPONENT_DEF_RE.search(source)
+    return {
+        'name': name,
+        'description': description,
+        'exported': definition is not None
+    }
+
+
+def index_file(path, kind):
+    """Parse one file into facts; never raises on bad input."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            source = f.read()
+        if kind == 'component':
+            return parse_component_source(Path(path).stem, source)
+        return parse_python_source(source)
+    except (OSError, SyntaxError, UnicodeDecodeError, ValueError) as e:
+        return {'error': str(e)}
+
+
+def _index_file_args(args):
+    """Unpack (path, kind) for ProcessPoolExecutor.map."""
+    return index_file(*args)
+
+
+class CodeIndexer:
+    """Incrementally index backend Python files and frontend components.
+
+    Per-file facts are cached in `.qstack/cache/code_index.json`, keyed on
+    size/mtime with a content-hash fallback, so only changed files are
+    re-parsed. Changed files are parsed in a process pool once there are
+    enough of them to pay for it.
+    """
+
+    def __init__(self, root='.', cache_dir=None, jobs=None):
+        self.root = Path(root)
+        if cache_dir is None:
+            cache_dir = self.root / '.qstack' / 'cache'
+        self.cache_file = Path(cache_dir) / 'code_index.json'
+        self.jobs = jobs
+        self.parsed_count = 0
+
+    def discover(self):
+        """Return sorted [(relpath, kind)] of files worth indexing."""
+        backend = self.root / 'backend'
+        frontend = self.root / 'frontend'
+        if not backend.is_dir() and not frontend.is_dir():
+            # api-only / frontend-only projects live at the root
+            backend = self.root if (self.root / 'manage.py').exists() else None
+            frontend = self.root if (self.root / 'src').is_dir() else None
+        elif not backend.is_dir():
+            backend = None
+
+        files = []
+        if backend is not None:
+            for dirpath, dirnames, filenames in os.walk(backend):
+                dirnames[:] = [name for name in dirnames
+                               if name not in PRUNED_DIRS and name != 'migrations'
+                               and name not in ('frontend', 'src', 'node_modules')
+                               and not os.path.exists(os.path.join(dirpath, name, 'pyvenv.cfg'))]
+                files.extend((os.path.join(dirpath, name), 'python')
+                             for name in filenames if name.endswith('.py'))
+
+        if frontend is not None and (frontend / 'src' / 'components').is_dir():
+            for path in (frontend / 'src' / 'components').rglob('*.jsx'):
+                files.append((str(path), 'component'))
+
+        return sorted((os.path.relpath(path, self.root), kind) for path, kind in files)
+
+    def index(self, use_cache=True):
+        """Return per-file facts, re-parsing only files that changed."""
+        cached = self._read_cache() if use_cache else {}
+        entries = {}
+        pending = []
+
+        for relpath, kind in self.discover():
+            path = self.root / relpath
+            stat = path.stat()
+            entry = cached.get(relpath)
+            if (entry and entry['kind'] == kind and entry['size'] == stat.st_size
+                    and entry['mtime_ns'] == stat.st_mtime_ns):
+                entries[relpath] = entry
+                continue
+
+            with open(path, 'rb') as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            if entry and entry['kind'] == kind and entry['sha256'] == digest:
+                entry = dict(entry, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+                entries[relpath] = entry
+                continue
+
+            entries[relpath] = {'kind': kind, 'size': stat.st_size,
+                                'mtime_ns': stat.st_mtime_ns, 'sha256': digest}
+            pending.append((relpath, kind))
+
+        args = [(str(self.root / relpath), kind) for relpath, kind in pending]
+        if len(args) >= PARALLEL_THRESHOLD and self.jobs != 1:
+            with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+                results = list(pool.map(_index_file_args, args, chunksize=8))
+        else:
+            results = [index_file(*arg) for arg in args]
+
+        for (relpath, _), facts in zip(pending, results):
+            entries[relpath]['facts'] = facts
+        self.parsed_count = len(pending)
+
+        if use_cache and (pending or set(entries) != set(cached)):
+            self._write_cache(entries)
+        return entries
+
+    def summary(self, use_cache=True):
+        """Aggregate file facts into models, viewsets, routes and components."""
+        entries = self.index(use_cache=use_cache)
+        models, viewsets, components = {}, {}, {}
+        registrations, includes = [], []
+
+        for relpath, entry in sorted(entries.items()):
+            facts = entry.get('facts') or {}
+            if 'error' in facts:
+                continue
+            if entry['kind'] == 'component':
+                components.setdefault(facts['name'], {
+                    'path': relpath, 'description': facts['description']})
+                continue
+            for model in facts['models']:
+                models.setdefault(model['name'], {'path': relpath, 'fields': model['fields']})
+            for viewset in facts['viewsets']:
+                viewsets.setdefault(viewset['name'], dict(viewset, path=relpath))
+            registrations.extend((relpath, item) for item in facts['registrations'])
+            includes.extend(item for item in facts['includes'])
+
+        return {
+            'models': models,
+            'viewsets': viewsets,
+            'routes': self._resolve_routes(registrations, includes),
+            'components': components,
+        }
+
+    def _resolve_routes(self, registrations, includes):
+        """Prefix router registrations with the path() that includes their module."""
+        mounts = {}
+        for include in includes:
+            mounts.setdefault(include['module'].replace('.', '/') + '.py', include['route'])
+
+        routes = []
+        for relpath, item in registrations:
+            mount = next((route for module, route in mounts.items()
+                          if relpath == module or relpath.endswith('/' + module)), '')
+            url = '/' + (mount + item['prefix']).strip('/') + '/'
+            routes.append({'url': url.replace('//', '/'), 'viewset': item['viewset'], 'path': relpath})
+        return sorted(routes, key=lambda route: route['url'])
+
+    def _read_cache(self):
+        """Return cached per-file entries, or {} if missing or stale."""
+        try:
+            with open(self.cache_file, 'r') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cached, dict) or cached.get('version') != INDEX_VERSION:
+            return {}
+        return cached.get('files') or {}
+
+    def _write_cache(self, entries):
+        """Persist per-file entries; a failed write only costs a re-parse next run."""
+        try:
+            atomic_write(self.cache_file, json.dumps({'version': INDEX_VERSION, 'files': entries}))
+        except OSError:
+            pass
@@ -0,0 +1,92 @@
+"""Section offset index for .qstack-context.md."""
+
+import os
+import json
+import mmap
+from pathlib import Path
+
+from .utils import atomic_write
+
+INDEX_VERSION = 1
+
+
+class ContextIndex:
+    """Map `## ` headings of a context file to byte ranges.
+
+    The index is persisted in `.qstack/cache/context_index.json` and rebuilt
+    only when the context file's size or mtime changes. Sections are read
+    through mmap, so showing one section never loads the whole file.
+    """
+
+    def __init__(self, context_file='.qstack-context.md', cache_dir=None):
+        self.context_file = Path(context_file)
+        if cache_dir is None:
+            cache_dir = self.context_file.parent / '.qstack' / 'cache'
+        self.index_file = Path(cache_dir) / 'context_index.json'
+        self._sections = None
+
+    @property
+    def sections(self):
+        """Return [(heading, offset, length), ...] in file order."""
+        if self._sections is None:
+            self._sections = self._load()
+        return self._sections
+
+    def find(self, name):
+        """Return sections whose heading contains `name` (case-insensitive)."""
+        needle = name.lower()
+        return [section for section in self.sections if needle in section[0].lower()]
+
+    def read(self, section):
+        """Read one (heading, offset, length) section as text."""
+        _, offset, length = section
+        with open(self.context_file, 'rb') as f:
+            if length == 0:
+                return ''
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm[offset:offset + length].decode('utf-8')
+
+    def _load(self):
+        """Load the persisted index, rebuilding it if the file changed."""
+        stat = self.context_file.stat()
+        try:
+            with open(self.index_file, 'r') as f:
+                cached = json.load(f)
+            if (cached.get('version') == INDEX_VERSION and cached['size'] == stat.st_size
+                    and cached['mtime_ns'] == stat.st_mtime_ns):
+                return [tuple(section) for section in cached['sections']]
+        except (OSError, ValueError, KeyError):
+            pass
+
+        sections = self._build()
+        try:
+            atomic_write(self.index_file, json.dumps({
+                'version': INDEX_VERSION,
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'sections': sections
+            }))
+        except OSError:
+            pass  # the index is an optimization; never fail the command over it
+        return [tuple(section) for section in sections]
+
+    def _build(self):
+        """Scan the file once for `## ` headings and record their byte ranges."""
+        with open(self.context_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                size = len(mm)
+                starts = [0] if mm[:3] == b'## ' else []
+                position = mm.find(b'\n## ')
+                while position != -1:
+                    starts.append(position + 1)
+                    position = mm.find(b'\n## ', position + 1)
+
+                sections = []
+                for i, start in enumerate(starts):
+                    end = starts[i + 1] if i + 1 < len(starts) else size
+                    line_end = mm.find(b'\n', start, end)
+                    heading = mm[start:line_end if line_end != -1 else end].decode('utf-8').strip()
+                    sections.append([heading, start, end - start])
+                return sections
@@ -0,0 +1,135 @@
+"""Detect and fingerprint the project inputs behind generated AI context files."""
+
+import os
+import json
+import hashlib
+from pathlib import Path
+
+import yaml
+
+from .utils import atomic_write
+
+STATE_VERSION = 1
+
+# Database images recognised in docker-compose services
+DATABASE_IMAGES = {
+    'postgres': 'postgres',
+    'postgis': 'postgres',
+    'mysql': 'mysql',
+    'mariadb': 'mysql',
+}
+
+
+def load_compose(root='.'):
+    """Parse docker-compose.yml, returning {} when it is missing or invalid."""
+    try:
+        with open(Path(root) / 'docker-compose.yml', 'r') as f:
+            compose = yaml.safe_load(f)
+    except (OSError, yaml.YAMLError):
+        return {}
+    return compose if isinstance(compose, dict) else {}
+
+
+def detect_database(compose):
+    """Return the database backing a parsed compose file.
+
+    Looks at the images of the declared services; a compose file without a
+    database service means the backend runs on SQLite. Without a compose
+    file the generator default (postgres) is assumed.
+    """
+    if not compose:
+        return 'postgres'
+
+    services = compose.get('services') or {}
+    for service in services.values():
+        if not isinstance(service, dict):
+            continue
+        image = str(service.get('image') or '')
+        # "mysql:8", "docker.io/library/postgres:15" -> "mysql", "postgres"
+        name = image.rsplit('/', 1)[-1].split(':', 1)[0].split('@', 1)[0].lower()
+        if name in DATABASE_IMAGES:
+            return DATABASE_IMAGES[name]
+    return 'sqlite'
+
+
+def detect_template_type(root='.'):
+    """Infer the template type from the frontend/backend layout."""
+    root = Path(root)
+    has_frontend = (root / 'frontend').is_dir()
+    has_backend = (root / 'backend').is_dir()
+
+    if has_frontend and not has_backend:
+        return 'frontend-only'
+    if has_backend and not has_frontend:
+        return 'api-only'
+    return 'fullstack'
+
+
+def input_files(root='.'):
+    """Return the files whose content feeds the generated context, sorted."""
+    root = Path(root)
+    files = [root / 'docker-compose.yml', root / 'AI_ANALYSIS.md']
+    files.extend(root.glob('backend/*/models.py'))
+    files.extend(root.glob('*/models.py'))
+    return sorted({path for path in files if path.is_file()})
+
+
+def input_fingerprint(root='.', template_path=None, extra=None):
+    """Hash everything generate-context depends on.
+
+    Covers the project name, the top-level directory layout, the content
+    of the compose file, AI_ANALYSIS.md and every models.py, plus the
+    context template itself so template upgrades trigger a rebuild.
+    `extra` is any JSON-serializable data that also feeds the context.
+    """
+    root = Path(root).resolve()
+    digest = hashlib.sha256()
+    digest.update(f'name:{root.name}\n'.encode('utf-8'))
+
+    for name in sorted(os.listdir(root)):
+        if (root / name).is_dir() and not name.startswith('.'):
+            digest.update(f'dir:{name}\n'.encode('utf-8'))
+
+    labelled = [(os.path.relpath(path, root), path) for path in input_files(root)]
+    if template_path is not None:
+        labelled.append(('<template>', Path(template_path)))
+
+    for label, path in labelled:
+        digest.update(f'file:{label}\n'.encode('utf-8'))
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(64 * 1024), b''):
+                digest.update(chunk)
+
+    if extra is not None:
+        digest.update(json.dumps(extra, sort_keys=True).encode('utf-8'))
+
+    return digest.hexdigest()
+
+
+class ContextState:
+    """Remembers the input fingerprint of the last context generation."""
+
+    def __init__(self, root='.', cache_dir=None):
+        if cache_dir is None:
+            cache_dir = Path(root) / '.qstack' / 'cache'
+        self.state_file = Path(cache_dir) / 'context_inputs.json'
+
+    def is_current(self, fingerprint):
+        """Return True if the last generation used the same inputs."""
+        try:
+            with open(self.state_file, 'r') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return False
+        return (isinstance(state, dict) and state.get('version') == STATE_VERSION
+                and state.get('fingerprint') == fingerprint)
+
+    def record(self, fingerprint):
+        """Persist the fingerprint; caching is best-effort."""
+        try:
+            atomic_write(self.state_file, json.dumps({
+                'version': STATE_VERSION,
+                'fingerprint': fingerprint
+            }))
+        except OSError:
+            pass
@@ -0,0 +1,208 @@
+"""Pack AI context into a token budget, ranked by relevance to a focus."""
+
+import re
+import json
+import math
+import hashlib
+from pathlib import Path
+
+from .utils import atomic_write
+
+PACK_VERSION = 1
+MAX_CACHED_PACKS = 32
+
+WORD_RE = re.compile(r'\w+|[^\w\s]')
+FOCUS_SPLIT_RE = re.compile(r'[^A-Za-z0-9]+|(?<=[a-z0-9])(?=[A-Z])')
+
+CODE_HEADING = '## 🔎 Indexed Code'
+
+
+def estimate_tokens(text):
+    """Cheaply estimate the BPE token count of `text`.
+
+    Words cost one token plus one per eight characters, every punctuation
+    or symbol character costs one. This deliberately errs on the high side
+    for code and markdown, and needs no tokenizer dependency.
+    """
+    return sum(1 + len(word) // 8 if word[0].isalnum() or word[0] == '_' else 1
+               for word in WORD_RE.findall(text))
+
+
+def focus_terms(focus):
+    """Split a path or feature name into lowercase search terms."""
+    return [term.lower() for term in FOCUS_SPLIT_RE.split(focus or '')
+            if len(term) > 1 and term.lower() not in ('py', 'jsx', 'js', 'src')]
+
+
+class ContextUnit:
+    """One packable piece of context: a markdown section or a code fact."""
+
+    __slots__ = ('kind', 'order', 'text', 'path', 'tokens', 'score')
+
+    def __init__(self, kind, order, text, path=None):
+        self.kind = kind
+        self.order = order
+        self.text = text
+        self.path = path
+        self.tokens = estimate_tokens(text)
+        self.score = 0.0
+
+    def rank(self, focus, terms):
+        """Score relevance: term hits, dampened by size, boosted by path matches."""
+        if not terms:
+            self.score = 0.0
+            return self.score
+
+        haystack = self.text.lower()
+        hits = sum(min(haystack.count(term), 5) for term in terms)
+        score = hits / math.sqrt(self.tokens + 1)
+        if self.path and focus and (self.path == focus or self.path.startswith(focus.rstrip('/') + '/')
+                                    or focus.endswith(self.path)):
+            score += 10
+        self.score = score
+        return score
+
+
+def code_units(code_index, start_order):
+    """Turn a CodeIndexer summary into one unit per model/ViewSet/route/component."""
+    units = []
+    order = start_order
+
+    for name, model in code_index.get('models', {}).items():
+        fields = ', '.join(f'{field}: {kind}' for field, kind in model['fields'].items())
+        units.append(ContextUnit('model', order, f"- Model `{name}` ({model['path']}): {fields}",
+                                 model['path']))
+        order += 1
+    for name, viewset in code_index.get('viewsets', {}).items():
+        wiring = ', '.join(part for part in (viewset.get('model'), viewset.get('serializer')) if part)
+        units.append(ContextUnit('viewset', order,
+                                 f"- ViewSet `{name}` ({viewset['path']}){': ' + wiring if wiring else ''}",
+                                 viewset['path']))
+        order += 1
+    for route in code_index.get('routes', []):
+        units.append(ContextUnit('route', order, f"- Route `{route['url']}` → `{route['viewset']}`",
+                                 route['path']))
+        order += 1
+    for name, component in code_index.get('components', {}).items():
+        description = f": {component['description']}" if component.get('description') else ''
+        units.append(ContextUnit('component', order,
+                                 f"- Component `{name}` ({component['path']}){description}",
+                                 component['path']))
+        order += 1
+
+    return units
+
+
+def pack_units(units, max_tokens=None, focus=None):
+    """Greedily select units by relevance under a token budget.
+
+    Units are taken in descending score (ties keep document order) and
+    skipped when they would overflow the budget, so a large irrelevant
+    section never crowds out several small relevant facts. With a focus
+    but no budget, only relevant units are kept.
+    """
+    terms = focus_terms(focus)
+    for unit in units:
+        unit.rank(focus, terms)
+
+    if max_tokens is None:
+        return [unit for unit in units if unit.score > 0 or not terms]
+
+    # The code-facts heading is paid for once, with the first fact
+    heading_tokens = estimate_tokens(_code_heading(focus))
+    has_facts = False
+
+    selected = []
+    used = 0
+    for unit in sorted(units, key=lambda u: (-u.score, u.order)):
+        cost = unit.tokens
+        if unit.kind != 'section' and not has_facts:
+            cost += heading_tokens
+        if used + cost <= max_tokens:
+            selected.append(unit)
+            used += cost
+            has_facts = has_facts or unit.kind != 'section'
+    return sorted(selected, key=lambda u: u.order)
+
+
+def _code_heading(focus):
+    """Heading placed above packed code facts."""
+    return f"{CODE_HEADING} (focus: {focus})" if focus else CODE_HEADING
+
+
+def render_pack(selected, focus=None):
+    """Reassemble selected units: sections in file order, then code facts."""
+    sections = [unit.text for unit in selected if unit.kind == 'section']
+    facts = [unit.text for unit in selected if unit.kind != 'section']
+
+    parts = [text if text.endswith('\n') else text + '\n' for text in sections]
+    if facts:
+        parts.append(_code_heading(focus) + '\n' + '\n'.join(facts) + '\n')
+    return ''.join(parts)
+
+
+class ContextPacker:
+    """Build and cache token-budgeted context packs.
+
+    Packs are cached in `.qstack/cache/context_packs.json` keyed on
+    (focus, budget, context hash), where the context hash covers the
+    context file bytes and the code index.
+    """
+
+    def __init__(self, context_index, code_index, cache_dir=None):
+        self.context_index = context_index
+        self.code_index = code_index
+        if cache_dir is None:
+            cache_dir = context_index.context_file.parent / '.qstack' / 'cache'
+        self.cache_file = Path(cache_dir) / 'context_packs.json'
+
+    def context_hash(self):
+        """Hash the context file and indexed code facts."""
+        digest = hashlib.sha256()
+        with open(self.context_index.context_file, 'rb') as f:
+            for chunk in iter(lambda: f.read(64 * 1024), b''):
+                digest.update(chunk)
+        digest.update(json.dumps(self.code_index, sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()
+
+    def units(self):
+        """Collect all packable units in document order."""
+        units = [ContextUnit('section', order, self.context_index.read(section))
+                 for order, section in enumerate(self.context_index.sections)]
+        return units + code_units(self.code_index, len(units))
+
+    def pack(self, max_tokens=None, focus=None, use_cache=True):
+        """Return (text, estimated_tokens, cache_hit)."""
+        key = hashlib.sha256(json.dumps([focus, max_tokens, self.context_hash()]).encode('utf-8')).hexdigest()
+        packs = self._read_cache() if use_cache else {}
+        if key in packs:
+            entry = packs[key]
+            return entry['text'], entry['tokens'], True
+
+        selected = pack_units(self.units(), max_tokens=max_tokens, focus=focus)
+        text = render_pack(selected, focus=focus)
+        tokens = estimate_tokens(text)
+
+        if use_cache:
+            packs[key] = {'text': text, 'tokens': tokens}
+            # Dicts keep insertion order, so the oldest packs are dropped first
+            self._write_cache(dict(list(packs.items())[-MAX_CACHED_PACKS:]))
+        return text, tokens, False
+
+    def _read_cache(self):
+        """Return cached packs, or {} if missing or stale."""
+        try:
+            with open(self.cache_file, 'r') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cached, dict) or cached.get('version') != PACK_VERSION:
+            return {}
+        return cached.get('packs') or {}
+
+    def _write_cache(self, packs):
+        """Store the most recent packs; an unwritable cache just means re-packing."""
+        try:
+            atomic_write(self.cache_file, json.dumps({'version': PACK_VERSION, 'packs': packs}))
+        except OSError:
+            pass
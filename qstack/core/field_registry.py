@@ -0,0 +1,124 @@
+"""Rule-based field inference for AI-generated Django models."""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import yaml
+
+DEFAULT_RULES_PATH = Path(__file__).parent.parent / 'templates' / 'ai' / 'field_rules.yml'
+
+# An index is a list of field names ("-" for descending), or a mapping with
+# `fields` and an optional `condition` ({field: value}) for a partial index
+IndexSpec = Union[List[str], Dict[str, Any]]
+
+
+def normalize_index(index: IndexSpec) -> Dict[str, Any]:
+    """Return an index as a fresh {'fields': [...], 'condition': {...}} dict."""
+    if isinstance(index, dict):
+        return {'fields': list(index['fields']), 'condition': dict(index.get('condition') or {})}
+    return {'fields': list(index), 'condition': {}}
+
+
+@dataclass
+class FieldRule:
+    """A named model shape selected by model/feature name patterns."""
+    name: str
+    match: str
+    fields: Dict[str, str]
+    feature: Optional[str] = None
+    indexes: List[IndexSpec] = field(default_factory=list)
+    foreign_keys: Dict[str, str] = field(default_factory=dict)
+
+    def __post_init__(self):
+        # Compile once; rules are evaluated for every model in the analysis
+        self._match_re = re.compile(self.match)
+        self._feature_re = re.compile(self.feature, re.IGNORECASE) if self.feature else None
+
+    def matches(self, model_name: str, feature_name: str) -> bool:
+        """Check whether this rule applies to the model in the given feature."""
+        if not self._match_re.search(model_name):
+            return False
+        return self._feature_re is None or bool(self._feature_re.search(feature_name or ''))
+
+
+class FieldInferenceRegistry:
+    """Ordered, memoized catalog of field inference rules.
+
+    The first matching rule wins. Rules loaded later can be placed ahead of
+    the defaults so teams can extend or override the shipped catalog.
+    """
+
+    def __init__(self, rules: Optional[List[FieldRule]] = None,
+                 common_fields: Optional[Dict[str, str]] = None):
+        self.rules = list(rules or [])
+        self.common_fields = dict(common_fields or {})
+        self._cache: Dict[Tuple[str, str], Dict] = {}
+
+    @classmethod
+    def default(cls, extra_rule_files=()) -> 'FieldInferenceRegistry':
+        """Build the registry from the shipped catalog plus optional YAML files."""
+        registry = cls()
+        registry.load_yaml(DEFAULT_RULES_PATH)
+        for path in extra_rule_files:
+            registry.load_yaml(path, prepend=True)
+        return registry
+
+    def load_yaml(self, path, prepend: bool = False):
+        """Load rules (and common fields) from a YAML catalog file."""
+        with open(path) as f:
+            data = yaml.safe_load(f) or {}
+
+        rules = [
+            FieldRule(
+                name=rule.get('name', rule['match']),
+                match=rule['match'],
+                fields=rule.get('fields') or {},
+                feature=rule.get('feature'),
+                indexes=rule.get('indexes') or [],
+                foreign_keys=rule.get('foreign_keys') or {},
+            )
+            for rule in data.get('rules', [])
+        ]
+        self.add_rules(rules, prepend=prepend)
+        self.common_fields.update(data.get('common_fields') or {})
+        self._cache.clear()
+
+    def add_rules(self, rules: List[FieldRule], prepend: bool = False):
+        """Register rules, ahead of existing ones when `prepend` is set."""
+        self.rules = rules + self.rules if prepend else self.rules + rules
+        self._cache.clear()
+
+    def infer(self, model_name: str, feature_name: str = '') -> Dict:
+        """Return fields, indexes and FK hints for a model.
+
+        Results are memoized per (model name, feature name).
+        """
+        key = (model_name, feature_name)
+        if key not in self._cache:
+            self._cache[key] = self._resolve(model_name, feature_name)
+
+        cached = self._cache[key]
+        return {
+            'rule': cached['rule'],
+            'fields': dict(cached['fields']),
+            'indexes': [normalize_index(index) for index in cached['indexes']],
+            'foreign_keys': dict(cached['foreign_keys']),
+        }
+
+    def _resolve(self, model_name: str, feature_name: str) -> Dict:
+        """Find the first matching rule and build its field set."""
+        fields = dict(self.common_fields)
+
+        for rule in self.rules:
+            if rule.matches(model_name, feature_name):
+                fields.update(rule.fields)
+                return {
+                    'rule': rule.name,
+                    'fields': fields,
+                    'indexes': rule.indexes,
+                    'foreign_keys': rule.foreign_keys,
+                }
+
+        return {'rule': None, 'fields': fields, 'indexes': [], 'foreign_keys': {}}
@@ -7,18 +7,50 @@ from jinja2 import Environment, FileSystemLoader
 from .template_manager import TemplateManager
 from .utils import generate_django_secret_key
 
+DB_POOLING_MODES = ['none', 'persistent', 'pool', 'pgbouncer']
+SERVER_MODES = ['wsgi', 'asgi']
+CACHE_BACKENDS = ['none', 'locmem', 'redis']
+PAGINATION_MODES = ['page', 'cursor']
+JSON_BACKENDS = ['stdlib', 'orjson']
+# MySQL/MariaDB ignore Index(condition=...) (models.W037)
+PARTIAL_INDEX_DATABASES = {'postgres', 'sqlite'}
+
+def db_pooling_error(database, db_pooling, server='wsgi'):
+    """Return why `db_pooling` can't be used with `database`, or None."""
+    if db_pooling in ('pool', 'pgbouncer') and database != 'postgres':
+        return f"--db-pooling {db_pooling} requires the postgres database"
+    if db_pooling != 'none' and database == 'sqlite':
+        return "SQLite has no server connections to pool; use --db-pooling none"
+    if db_pooling == 'persistent' and server == 'asgi':
+        # Django closes persistent connections per async task, so they are never reused
+        return "--db-pooling persistent doesn't work under ASGI; use pool or pgbouncer"
+    return None
+
 class ProjectGenerator:
     """Main project generator class."""
     
-    def __init__(self, project_name, template_type, database):
+    def __init__(self, project_name, template_type, database, db_pooling='none', server='wsgi',
+                 cache='none', pagination='page', json_backend='stdlib'):
+        error = db_pooling_error(database, db_pooling, server)
+        if error:
+            raise ValueError(error)
+        
         self.project_name = project_name
         self.template_type = template_type
         self.database = database
+        self.db_pooling = db_pooling
+        self.server = server
+        self.cache = cache
+        self.pagination = pagination
+        self.json_backend = json_backend
         self.template_manager = TemplateManager()
         
         # Get templates directory
         self.templates_dir = Path(__file__).parent.parent / 'templates'
         
+        # Shared Jinja2 environment so compiled templates are reused across renders
+        self.env = Environment(loader=FileSystemLoader(self.templates_dir), keep_trailing_newline=True)
+        
     def generate(self):
         """Generate the project structure."""
         
@@ -29,14 +61,7 @@ class ProjectGenerator:
         project_path.mkdir()
         
         # Template context
-        context = {
-            'project_name': self.project_name,
-            'project_name_snake': self.project_name.replace('-', '_'),
-            'project_name_pascal': self._to_pascal_case(self.project_name),
-            'database': self.database,
-            'template_type': self.template_type,
-            'django_secret_key': generate_django_secret_key(),
-        }
+        context = self._build_context()
         
         # Generate based on template type
         if self.template_type == 'fullstack':
@@ -46,6 +71,25 @@ class ProjectGenerator:
         elif self.template_type == 'api-only':
             self._generate_api_only(project_path, context)
     
+    def _build_context(self):
+        """Build the template context shared by all rendered files."""
+        return {
+            'project_name': self.project_name,
+            'project_name_snake': self.project_name.replace('-', '_'),
+            'project_name_pascal': self._to_pascal_case(self.project_name),
+            'database': self.database,
+            'db_pooling': self.db_pooling,
+            'server': self.server,
+            'cache': self.cache,
+            'pagination': self.pagination,
+            'json_backend': self.json_backend,
+            'partial_indexes': self.database in PARTIAL_INDEX_DATABASES,
+            'template_type': self.template_type,
+            'django_secret_key': generate_django_secret_key(),
+            'extra_apps': [],
+            'extra_requirements': [],
+        }
+    
     def _generate_fullstack(self, project_path, context):
         """Generate fullstack project with frontend + backend + docker."""
         
@@ -92,6 +136,14 @@ class ProjectGenerator:
     def _generate_django_backend(self, backend_path, context):
         """Generate Django backend."""
         self._copy_template('backend', backend_path, context)
+        
+        project_package = backend_path / f"{context['project_name_snake']}_project"
+        if context['server'] == 'asgi' or context['pagination'] == 'cursor':
+            self._render_template('pagination/pagination.py.j2', project_package / 'pagination.py', context)
+        if context['cache'] != 'none':
+            self._render_template('cache/cache.py.j2', project_package / 'cache.py', context)
+        if context['json_backend'] == 'orjson':
+            self._render_template('json/renderers.py.j2', project_package / 'renderers.py', context)
     
     def _generate_docker_files(self, project_path, context):
         """Generate Docker configuration."""
@@ -232,12 +284,11 @@ For full context, see .qstack-context.md
     
     def _render_template(self, template_name, dest_path, context):
         """Render a single template file."""
-        env = Environment(loader=FileSystemLoader(self.templates_dir))
-        template = env.get_template(template_name)
-        content = template.render(**context)
+        template = self.env.get_template(template_name)
         
+        # Stream rendered chunks straight to disk instead of building one big string
         with open(dest_path, 'w') as f:
-            f.write(content)
+            template.stream(**context).dump(f)
     
     def _render_template_file(self, template_path, dest_path, context):
         """Render a template file with Jinja2."""
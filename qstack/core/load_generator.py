@@ -0,0 +1,255 @@
+"""Asyncio HTTP load generator for generated backends (`qstack bench api`)."""
+
+import re
+import ssl
+import json
+import time
+import asyncio
+from bisect import bisect_left
+from collections import Counter
+from itertools import cycle
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from .request_profile import percentile
+
+# Upper bounds (ms) of the latency histogram buckets; slower requests go in a final bucket
+HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+_INCLUDE_RE = re.compile(r"""path\(\s*r?['"]([^'"]*)['"]\s*,\s*include\(\s*['"]([\w.]+)['"]""")
+_REGISTER_RE = re.compile(r"""router\.register\(\s*r?['"]([^'"]+)['"]""")
+
+# Failures where no HTTP response was received
+TRANSPORT_ERRORS = (OSError, EOFError, ValueError, asyncio.IncompleteReadError, asyncio.LimitOverrunError)
+
+
+class HTTPConnection:
+    """A keep-alive HTTP/1.1 connection that reconnects as needed."""
+
+    def __init__(self, base_url, headers=None):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError(f"Expected an http(s) URL, got '{base_url}'")
+        self.host = parts.hostname
+        self.tls = parts.scheme == 'https'
+        self.port = parts.port or (443 if self.tls else 80)
+        self.prefix = parts.path.rstrip('/')
+        host_header = parts.netloc.rsplit('@', 1)[-1]
+        extra = ''.join(f'{name}: {value}\r\n' for name, value in (headers or {}).items())
+        self.head = (f'Host: {host_header}\r\nAccept: application/json\r\n'
+                     f'User-Agent: qstack-bench\r\n{extra}\r\n').encode('latin-1')
+        self.reader = self.writer = None
+
+    async def open(self):
+        context = ssl.create_default_context() if self.tls else None
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port, ssl=context)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+    async def request(self, method, path):
+        """Send one request and return (status, body)."""
+        if self.writer is None:
+            await self.open()
+        self.writer.write(f'{method} {self.prefix}{path} HTTP/1.1\r\n'.encode('latin-1') + self.head)
+        await self.writer.drain()
+
+        head = (await self.reader.readuntil(b'\r\n\r\n')).decode('latin-1').split('\r\n')
+        status = int(head[0].split(' ', 2)[1])
+        headers = {}
+        for line in head[1:]:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip().lower()
+
+        if method == 'HEAD' or status in (204, 304) or status < 200:
+            body = b''
+        elif 'chunked' in headers.get('transfer-encoding', ''):
+            body = await self._read_chunked()
+        elif 'content-length' in headers:
+            body = await self.reader.readexactly(int(headers['content-length']))
+        else:
+            body = await self.reader.read()
+            headers['connection'] = 'close'
+
+        if headers.get('connection') == 'close':
+            self.close()
+        return status, body
+
+    async def _read_chunked(self):
+        chunks = []
+        while True:
+            size = int((await self.reader.readuntil(b'\r\n')).split(b';', 1)[0], 16)
+            if size == 0:
+                while await self.reader.readuntil(b'\r\n') != b'\r\n':
+                    pass  # trailers
+                return b''.join(chunks)
+            chunks.append(await self.reader.readexactly(size))
+            await self.reader.readexactly(2)
+
+
+class LoadStats:
+    """Latencies, status codes and transport errors per endpoint."""
+
+    def __init__(self, paths):
+        self.latencies = {path: [] for path in paths}
+        self.statuses = {path: Counter() for path in paths}
+        self.errors = {path: Counter() for path in paths}
+        self.elapsed = 0.0
+
+    def add(self, path, status, seconds):
+        self.latencies[path].append(seconds * 1000)
+        self.statuses[path][status] += 1
+
+    def add_error(self, path, kind):
+        self.errors[path][kind] += 1
+
+    def summary(self):
+        """Return throughput, latency percentiles, histogram and error rates, overall and per endpoint."""
+        overall = self._summarize(
+            [ms for values in self.latencies.values() for ms in values],
+            sum(self.statuses.values(), Counter()),
+            sum(self.errors.values(), Counter()))
+        latencies = sorted(ms for values in self.latencies.values() for ms in values)
+        buckets = Counter(bisect_left(HISTOGRAM_BOUNDS_MS, ms) for ms in latencies)
+        overall['histogram'] = [
+            {'le_ms': bound, 'count': buckets[index]}
+            for index, bound in enumerate((*HISTOGRAM_BOUNDS_MS, None))
+        ]
+        overall['endpoints'] = [
+            dict(path=path, **self._summarize(self.latencies[path], self.statuses[path], self.errors[path]))
+            for path in self.latencies
+        ]
+        return overall
+
+    def _summarize(self, latencies, statuses, errors):
+        latencies = sorted(latencies)
+        failed = sum(count for status, count in statuses.items() if status >= 400) + sum(errors.values())
+        attempts = len(latencies) + sum(errors.values())
+        return {
+            'requests': attempts,
+            'throughput_rps': round(len(latencies) / self.elapsed, 1) if self.elapsed else None,
+            'error_rate': round(failed / attempts, 4) if attempts else None,
+            'status_codes': {str(status): count for status, count in sorted(statuses.items())},
+            'transport_errors': dict(errors),
+            'latency_ms': {
+                'p50': _round(percentile(latencies, 0.50)),
+                'p95': _round(percentile(latencies, 0.95)),
+                'p99': _round(percentile(latencies, 0.99)),
+                'max': _round(latencies[-1] if latencies else None),
+                'mean': _round(sum(latencies) / len(latencies) if latencies else None),
+            },
+        }
+
+
+def _round(value):
+    return None if value is None else round(value, 3)
+
+
+async def _worker(connection, next_path, keep_going, stats, timeout):
+    while keep_going():
+        path = next(next_path)
+        start = time.perf_counter()
+        try:
+            status, _ = await asyncio.wait_for(connection.request('GET', path), timeout)
+        except asyncio.TimeoutError:
+            stats.add_error(path, 'timeout')
+            connection.close()
+            continue
+        except TRANSPORT_ERRORS:
+            stats.add_error(path, 'connection')
+            connection.close()
+            continue
+        stats.add(path, status, time.perf_counter() - start)
+
+
+async def run_load(base_url, paths, concurrency=10, duration=10.0, requests=None, timeout=10.0, headers=None):
+    """GET `paths` round-robin from `concurrency` keep-alive connections.
+
+    Stops after `requests` requests when given, otherwise after `duration`
+    seconds, and returns the LoadStats.
+    """
+    stats = LoadStats(paths)
+    next_path = cycle(paths)
+    if requests is not None:
+        tickets = iter(range(requests))
+        keep_going = lambda: next(tickets, None) is not None  # noqa: E731
+    else:
+        stop_at = time.perf_counter() + duration
+        keep_going = lambda: time.perf_counter() < stop_at  # noqa: E731
+
+    connections = [HTTPConnection(base_url, headers) for _ in range(concurrency)]
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(_worker(connection, next_path, keep_going, stats, timeout)
+                               for connection in connections))
+    finally:
+        stats.elapsed = time.perf_counter() - start
+        for connection in connections:
+            connection.close()
+    return stats
+
+
+def router_paths(project_path):
+    """Return the list URLs registered on a generated project's DRF routers.
+
+    Reads `<name>_project/urls.py` and the app urls.py files it includes
+    (in `project_path` or its backend/ directory). Returns [] when no
+    generated backend is found there.
+    """
+    root = Path(project_path)
+    backend = root if (root / 'manage.py').exists() else root / 'backend'
+    paths = []
+    for project_urls in sorted(backend.glob('*_project/urls.py')):
+        for prefix, module in _INCLUDE_RE.findall(project_urls.read_text()):
+            app_urls = backend.joinpath(*module.split('.')).with_suffix('.py')
+            if not app_urls.exists():
+                continue
+            for route in _REGISTER_RE.findall(app_urls.read_text()):
+                path = f'/{prefix}{route.strip("^$/")}/'
+                if path not in paths:
+                    paths.append(path)
+    return paths
+
+
+def _items(body):
+    """Return the objects of a list response (paginated or not)."""
+    data = json.loads(body)
+    if isinstance(data, dict):
+        data = data.get('results')
+    return data if isinstance(data, list) else []
+
+
+async def discover_endpoints(base_url, list_paths=None, api_root='/api/', headers=None):
+    """Build the request mix: each list endpoint plus the detail URL of its first row.
+
+    Without `list_paths`, list endpoints are read from the DRF API root.
+    """
+    connection = HTTPConnection(base_url, headers)
+    try:
+        if not list_paths:
+            status, body = await connection.request('GET', api_root)
+            if status != 200:
+                raise ValueError(f'GET {api_root} returned {status}')
+            root = json.loads(body)
+            list_paths = [urlsplit(url).path for url in root.values() if isinstance(url, str)] \
+                if isinstance(root, dict) else []
+            prefix = connection.prefix
+            list_paths = [path[len(prefix):] if prefix and path.startswith(prefix) else path for path in list_paths]
+
+        paths = []
+        for path in list_paths:
+            paths.append(path)
+            status, body = await connection.request('GET', path)
+            if status != 200:
+                continue
+            try:
+                items = _items(body)
+            except ValueError:
+                continue
+            if items and isinstance(items[0], dict) and 'id' in items[0]:
+                paths.append(f"{path.rstrip('/')}/{items[0]['id']}/")
+        return paths
+    finally:
+        connection.close()
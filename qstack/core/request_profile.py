@@ -0,0 +1,92 @@
+"""Summarize the per-request instrumentation logs of generated backends."""
+
+import json
+import math
+from collections import Counter
+
+EVENT = 'api.request'
+
+SORT_KEYS = {
+    'requests': lambda row: row['requests'],
+    'p95': lambda row: row['p95_ms'],
+    'queries': lambda row: row['avg_queries'],
+    'sql': lambda row: row['avg_sql_ms'],
+    'n_plus_one': lambda row: row['n_plus_one'],
+}
+
+
+def parse_log_lines(lines):
+    """Yield the instrumentation entries found in `lines`.
+
+    Anything before the first brace is ignored, so prefixed output such as
+    `docker compose logs` ("backend-1  | {...}") parses as well. Lines that
+    are not instrumentation entries are skipped.
+    """
+    for line in lines:
+        start = line.find('{')
+        if start < 0:
+            continue
+        try:
+            entry = json.loads(line[start:])
+        except ValueError:
+            continue
+        if isinstance(entry, dict) and entry.get('event') == EVENT:
+            yield entry
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not values:
+        return None
+    return values[max(math.ceil(fraction * len(values)) - 1, 0)]
+
+
+def summarize(entries, sort='p95'):
+    """Group entries per endpoint and return one summary row each, sorted by `sort`.
+
+    Requests are keyed by method and URL pattern name, falling back to the
+    path for requests that did not resolve (404s).
+    """
+    groups = {}
+    for entry in entries:
+        key = (entry.get('method', '?'), entry.get('endpoint') or entry.get('path', '?'))
+        groups.setdefault(key, []).append(entry)
+
+    rows = []
+    for (method, endpoint), group in groups.items():
+        count = len(group)
+        view_ms = sorted(entry.get('view_ms', 0) for entry in group)
+        queries = [entry.get('queries', 0) for entry in group]
+        sizes = [entry['bytes'] for entry in group if entry.get('bytes') is not None]
+        statuses = [entry.get('status', 0) for entry in group]
+
+        shapes = Counter()
+        flagged = 0
+        for entry in group:
+            repeated = entry.get('n_plus_one') or []
+            flagged += bool(repeated)
+            for shape in repeated:
+                shapes[shape['sql']] = max(shapes[shape['sql']], shape['count'])
+
+        rows.append({
+            'method': method,
+            'endpoint': endpoint,
+            'requests': count,
+            'client_errors': sum(1 for code in statuses if 400 <= code < 500),
+            'server_errors': sum(1 for code in statuses if code >= 500),
+            'p50_ms': percentile(view_ms, 0.50),
+            'p95_ms': percentile(view_ms, 0.95),
+            'max_ms': view_ms[-1],
+            'avg_queries': round(sum(queries) / count, 1),
+            'max_queries': max(queries),
+            'avg_sql_ms': round(sum(entry.get('sql_ms', 0) for entry in group) / count, 3),
+            'avg_bytes': round(sum(sizes) / len(sizes)) if sizes else None,
+            'n_plus_one': flagged,
+            'worst_repeated': (
+                {'sql': shapes.most_common(1)[0][0], 'count': shapes.most_common(1)[0][1]}
+                if shapes else None
+            ),
+        })
+
+    rows.sort(key=SORT_KEYS[sort], reverse=True)
+    return rows
@@ -0,0 +1,77 @@
+"""Discover QStack projects under a root and aggregate their status."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from .status_parser import StatusParser
+from .utils import PRUNED_DIRS
+
+SCOPE_FILE = 'defineprojectscope.md'
+
+
+def discover_projects(root):
+    """Return sorted directories under `root` that contain a scope file.
+
+    Dependency folders, VCS metadata and virtualenvs are pruned while
+    walking so they are never descended into.
+    """
+    projects = []
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        if SCOPE_FILE in filenames:
+            projects.append(dirpath)
+
+        dirnames[:] = [
+            name for name in dirnames
+            if name not in PRUNED_DIRS
+            and not os.path.exists(os.path.join(dirpath, name, 'pyvenv.cfg'))
+        ]
+
+    return sorted(projects)
+
+
+def project_summary(project_dir, use_cache=True):
+    """Parse one project's scope file into a summary row."""
+    try:
+        progress = StatusParser(Path(project_dir) / SCOPE_FILE).get_progress(use_cache=use_cache)
+    except Exception as e:
+        return {'path': project_dir, 'error': str(e), 'completed': 0, 'total': 0, 'percentage': None}
+
+    total = len(progress['features'])
+    completed = sum(1 for f in progress['features'] if f['completed'])
+    return {
+        'path': project_dir,
+        'completed': completed,
+        'total': total,
+        'percentage': round(completed / total * 100, 1) if total else None,
+    }
+
+
+def aggregate_status(root, jobs=None, use_cache=True):
+    """Summarize every project under `root`, parsing them in a process pool."""
+    projects = discover_projects(root)
+    summarize = partial(project_summary, use_cache=use_cache)
+
+    if len(projects) > 1 and jobs != 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            rows = list(pool.map(summarize, projects, chunksize=4))
+    else:
+        rows = [summarize(project) for project in projects]
+
+    for row in rows:
+        row['path'] = os.path.relpath(row['path'], root)
+
+    completed = sum(row['completed'] for row in rows)
+    total = sum(row['total'] for row in rows)
+    return {
+        'root': str(root),
+        'projects': rows,
+        'totals': {
+            'projects': len(rows),
+            'completed': completed,
+            'total': total,
+            'percentage': round(completed / total * 100, 1) if total else None,
+        }
+    }
@@ -1,94 +1,247 @@
 """Parse defineprojectscope.md for status tracking."""
 
 import re
+import json
+import hashlib
 from pathlib import Path
 
+from .utils import atomic_write
+
+CACHE_VERSION = 1
+
+# Line patterns, compiled once. Every pattern is anchored to a single line,
+# so parsing is one linear pass with no cross-line backtracking.
+CHECKBOX_RE = re.compile(r'^[-*+]\s*\[([xX\s])\]\s*(.+?)\s*$')
+CHECKBOX_DESCRIPTION_RE = re.compile(r'^\s*-\s*(?!\[[xX\s]\])(.+?)\s*$')
+NUMBERED_FEATURE_RE = re.compile(r'^\d+\.\s*\*\*(.+?)\*\*\s*$')
+HEADING_FEATURE_RE = re.compile(r'###\s*\d+\.\s*\*\*(.+?)\*\*')
+DESCRIPTION_RE = re.compile(r'-\s*\*\*Description\*\*:\s*(.+?)\s*$')
+STATUS_RE = re.compile(r'-\s*\*\*Status\*\*:\s*(.+?)\s*$')
+NEXT_STEPS_RE = re.compile(r'##\s*Next Steps', re.IGNORECASE)
+LIST_ITEM_RE = re.compile(r'^[-*+]\s*(.+?)\s*$')
+
+
 class StatusParser:
     """Parse project scope markdown for progress tracking."""
-    
-    def __init__(self, scope_file_path):
+
+    def __init__(self, scope_file_path, cache_dir=None):
         self.scope_file = Path(scope_file_path)
-    
-    def get_progress(self):
-        """Parse the scope file and return progress data."""
+        if cache_dir is None:
+            cache_dir = self.scope_file.parent / '.qstack' / 'cache'
+        self.cache_file = Path(cache_dir) / 'status.json'
+
+    def get_progress(self, use_cache=True):
+        """Parse the scope file and return progress data.
+
+        The parsed result is cached in `.qstack/cache/status.json`, keyed on
+        the file's size, mtime and content hash.
+        """
         if not self.scope_file.exists():
             return {'features': [], 'next_steps': []}
-        
-        with open(self.scope_file, 'r') as f:
-            content = f.read()
-        
-        features = self._parse_features(content)
-        next_steps = self._parse_next_steps(content)
-        
+
+        if not use_cache:
+            with open(self.scope_file, 'r') as f:
+                return self.parse_lines(f)
+
+        stat = self.scope_file.stat()
+        cached = self._read_cache()
+
+        # Fast path: unchanged size and mtime means the file was not touched
+        if (cached and cached['size'] == stat.st_size
+                and cached['mtime_ns'] == stat.st_mtime_ns):
+            return cached['progress']
+
+        with open(self.scope_file, 'rb') as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+
+        if cached and cached['sha256'] == digest:
+            progress = cached['progress']
+        else:
+            progress = self.parse_lines(raw.decode('utf-8').splitlines())
+
+        self._write_cache({
+            'version': CACHE_VERSION,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': digest,
+            'progress': progress
+        })
+        return progress
+
+    def _read_cache(self):
+        """Return the cached entry, or None if missing, stale or unreadable."""
+        try:
+            with open(self.cache_file, 'r') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(cached, dict) or cached.get('version') != CACHE_VERSION:
+            return None
+        return cached
+
+    def _write_cache(self, entry):
+        """Persist a cache entry; caching is best-effort."""
+        try:
+            atomic_write(self.cache_file, json.dumps(entry))
+        except OSError:
+            pass
+
+    def parse_lines(self, lines):
+        """Parse features and next steps from an iterable of lines in one pass.
+
+        Recognizes checkbox items (optionally followed by a `- description`
+        line), numbered `**Feature**` items and `### N. **Feature**` headings
+        with `**Description**`/`**Status**` bullets, plus the Next Steps list.
+        """
+        features = []
+        next_steps = []
+
+        checkbox = None      # checkbox feature waiting for an optional description line
+        block = None         # numbered/heading feature collecting description and status
+        in_next_steps = False
+        seen_next_steps = False
+
+        for line in lines:
+            line = line.rstrip('\n')
+
+            if checkbox is not None:
+                match = CHECKBOX_DESCRIPTION_RE.match(line)
+                if match and not CHECKBOX_RE.match(line.lstrip()):
+                    checkbox['description'] = match.group(1)
+                    features.append(checkbox)
+                    checkbox = None
+                    continue
+                features.append(checkbox)
+                checkbox = None
+
+            is_heading = line.startswith('#')
+            heading_match = HEADING_FEATURE_RE.search(line)
+            numbered_match = None if heading_match else NUMBERED_FEATURE_RE.match(line)
+
+            # Any heading or new feature closes the current block
+            if block is not None and (is_heading or heading_match or numbered_match):
+                self._close_block(block, features)
+                block = None
+
+            # Next Steps section runs until the next heading
+            if is_heading:
+                in_next_steps = False
+                if not seen_next_steps and NEXT_STEPS_RE.search(line):
+                    in_next_steps = seen_next_steps = True
+                    if heading_match is None:
+                        continue
+
+            if heading_match or numbered_match:
+                name = (heading_match or numbered_match).group(1).strip()
+                block = {'name': name, 'description': None, 'status': None}
+                continue
+
+            if block is not None:
+                if block['description'] is None:
+                    match = DESCRIPTION_RE.search(line)
+                    if match:
+                        block['description'] = match.group(1)
+                        continue
+                elif block['status'] is None:
+                    match = STATUS_RE.search(line)
+                    if match:
+                        block['status'] = match.group(1)
+                        self._close_block(block, features)
+                        block = None
+                        continue
+
+            match = CHECKBOX_RE.match(line)
+            if match:
+                checkbox = {
+                    'name': match.group(2),
+                    'description': '',
+                    'completed': match.group(1).lower() == 'x'
+                }
+
+            if in_next_steps:
+                match = LIST_ITEM_RE.match(line)
+                if match:
+                    next_steps.append(match.group(1))
+
+        if checkbox is not None:
+            features.append(checkbox)
+        if block is not None:
+            self._close_block(block, features)
+
         return {
             'features': features,
             'next_steps': next_steps
         }
-    
-    def _parse_features(self, content):
-        """Parse feature list from markdown."""
+
+    def _close_block(self, block, features):
+        """Record a numbered/heading feature once it has a description and status."""
+        if block['description'] is None or block['status'] is None:
+            return
+
+        status = block['status']
+        features.append({
+            'name': block['name'],
+            'description': block['description'],
+            'completed': 'implemented' in status.lower() or '✓' in status
+        })
+
+
+class SectionIndex:
+    """Section -> features index for incremental re-parsing.
+
+    The scope file is split at heading lines. No parser state crosses a
+    heading (except which Next Steps section came first), so each section
+    can be parsed on its own and reused until its text changes.
+    """
+
+    def __init__(self, parser):
+        self.parser = parser
+        self._sections = {}
+
+    def update(self, text):
+        """Re-parse only changed sections of `text`.
+
+        Returns (progress, reparsed) where `reparsed` is the number of
+        sections that had to be parsed.
+        """
+        sections = {}
         features = []
-        
-        # Look for checkbox lists
-        pattern = r'^[-*+]\s*\[([x\s])\]\s*(.+?)(?:\n\s*-\s*(.+?))?$'
-        
-        for match in re.finditer(pattern, content, re.MULTILINE):
-            completed = match.group(1).lower() == 'x'
-            name = match.group(2).strip()
-            description = match.group(3).strip() if match.group(3) else ''
-            
-            features.append({
-                'name': name,
-                'description': description,
-                'completed': completed
-            })
-        
-        # Look for numbered features with status
-        pattern = r'^\d+\.\s*\*\*(.+?)\*\*\s*\n\s*-\s*\*\*Description\*\*:\s*(.+?)\n\s*-\s*\*\*Status\*\*:\s*(.+?)(?:\s*[✓✗])?'
-        
-        for match in re.finditer(pattern, content, re.MULTILINE | re.DOTALL):
-            name = match.group(1).strip()
-            description = match.group(2).strip()
-            status = match.group(3).strip()
-            completed = 'implemented' in status.lower() or '✓' in status
-            
-            features.append({
-                'name': name,
-                'description': description,
-                'completed': completed
-            })
-        
-        # Look for ### headings with status on separate lines
-        pattern = r'###\s*\d+\.\s*\*\*(.+?)\*\*.*?\n.*?-\s*\*\*Description\*\*:\s*(.+?)\n.*?-\s*\*\*Status\*\*:\s*(.+?)(?:\n|$)'
-        
-        for match in re.finditer(pattern, content, re.MULTILINE | re.DOTALL):
-            name = match.group(1).strip()
-            description = match.group(2).strip()
-            status = match.group(3).strip()
-            completed = 'implemented' in status.lower() or '✓' in status
-            
-            features.append({
-                'name': name,
-                'description': description,
-                'completed': completed
-            })
-        
-        return features
-    
-    def _parse_next_steps(self, content):
-        """Parse next steps from markdown."""
-        next_steps = []
-        
-        # Look for "Next Steps" section
-        next_steps_match = re.search(r'##\s*Next Steps.*?\n(.*?)(?=\n##|\n#|$)', content, re.DOTALL | re.IGNORECASE)
-        
-        if next_steps_match:
-            steps_content = next_steps_match.group(1)
-            
-            # Parse list items
-            for match in re.finditer(r'^[-*+]\s*(.+?)$', steps_content, re.MULTILINE):
-                step = match.group(1).strip()
-                if step:
-                    next_steps.append(step)
-        
-        return next_steps
\ No newline at end of file
+        next_steps = None
+        reparsed = 0
+
+        for section in self._split_sections(text):
+            key = hashlib.blake2b(section.encode('utf-8'), digest_size=16).digest()
+            parsed = sections.get(key) or self._sections.get(key)
+            if parsed is None:
+                parsed = self._parse_section(section)
+                reparsed += 1
+            sections[key] = parsed
+
+            features.extend(parsed['features'])
+            if next_steps is None and parsed['is_next_steps']:
+                next_steps = parsed['next_steps']
+
+        self._sections = sections
+        return {'features': features, 'next_steps': next_steps or []}, reparsed
+
+    def _parse_section(self, section):
+        """Parse one heading-delimited section."""
+        lines = section.splitlines()
+        progress = self.parser.parse_lines(lines)
+        first = lines[0] if lines else ''
+        progress['is_next_steps'] = first.startswith('#') and bool(NEXT_STEPS_RE.search(first))
+        return progress
+
+    @staticmethod
+    def _split_sections(text):
+        """Split text into chunks that each start at a heading line."""
+        section = []
+        for line in text.splitlines(keepends=True):
+            if line.startswith('#') and section:
+                yield ''.join(section)
+                section = []
+            section.append(line)
+        if section:
+            yield ''.join(section)
@@ -1,10 +1,21 @@
 """Utility functions for QStack."""
 
+import os
 import secrets
 import string
 import subprocess
+from pathlib import Path
 from typing import Tuple
 
+# Directories never worth walking into when scanning for projects or code. Generic
+# names such as build/ or env/ are not listed (they may be real projects);
+# virtualenvs under any name are recognised by their pyvenv.cfg instead.
+PRUNED_DIRS = {
+    'node_modules', '.git', '.hg', '.svn', '.venv', '.env',
+    '.tox', '.nox', '__pycache__', '.mypy_cache', '.pytest_cache', '.qstack',
+    'site-packages',
+}
+
 def generate_django_secret_key():
     """Generate a secure Django secret key."""
     chars = string.ascii_letters + string.digits + '!@#$%^&*(-_=+)'
@@ -47,4 +58,17 @@ def detect_docker_compose() -> Tuple[str, bool]:
     except FileNotFoundError:
         pass
     
-    return 'docker compose', False
\ No newline at end of file
+    return 'docker compose', False
+
+def atomic_write(path, content):
+    """Write text to `path` via a temp file and rename, so readers never see a partial file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    try:
+        with open(tmp_file, 'w') as f:
+            f.write(content)
+        os.replace(tmp_file, path)
+    finally:
+        if tmp_file.exists():
+            tmp_file.unlink()
@@ -0,0 +1,72 @@
+"""File change watching with inotify (via watchdog) and a polling fallback."""
+
+import os
+import time
+import threading
+from pathlib import Path
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # watchdog is optional; fall back to polling
+    FileSystemEventHandler = object
+    Observer = None
+
+
+def _signature(path):
+    """Return a cheap change signature for a file, or None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class _ChangeHandler(FileSystemEventHandler):
+    """Set an event whenever the watched file is written, created or replaced."""
+
+    def __init__(self, path, changed):
+        self.path = str(path)
+        self.changed = changed
+
+    def on_any_event(self, event):
+        paths = (getattr(event, 'src_path', None), getattr(event, 'dest_path', None))
+        if self.path in (os.path.abspath(p) for p in paths if p):
+            self.changed.set()
+
+
+def watch_file(path, interval=1.0, use_inotify=True):
+    """Yield whenever `path` changes.
+
+    Uses watchdog's native observer (inotify on Linux) when it is installed,
+    otherwise polls size/mtime every `interval` seconds. The parent directory
+    is watched so editors that save by atomic rename are picked up too.
+    """
+    path = Path(path).resolve()
+    last = _signature(path)
+
+    if use_inotify and Observer is not None:
+        changed = threading.Event()
+        observer = Observer()
+        observer.schedule(_ChangeHandler(path, changed), str(path.parent), recursive=False)
+        observer.start()
+        try:
+            while True:
+                # Short waits keep Ctrl+C responsive
+                if not changed.wait(timeout=0.5):
+                    continue
+                changed.clear()
+                current = _signature(path)
+                if current != last:
+                    last = current
+                    yield
+        finally:
+            observer.stop()
+            observer.join()
+    else:
+        while True:
+            time.sleep(interval)
+            current = _signature(path)
+            if current != last:
+                last = current
+                yield
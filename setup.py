@@ -13,6 +13,9 @@ setup(
         "pyyaml>=6.0",
         "requests>=2.25.0",
     ],
+    extras_require={
+        "watch": ["watchdog>=2.0"],
+    },
     entry_points={
         "console_scripts": [
             "qstack=qstack.cli:main",
@@ -0,0 +1,131 @@
+"""Tests for qstack.core.load_generator against an in-process HTTP stub."""
+
+import json
+import asyncio
+import unittest
+from collections import Counter
+
+from qstack.core.load_generator import HTTPConnection, discover_endpoints, run_load
+
+
+def _response(status, body=b'', *headers):
+    lines = [f'HTTP/1.1 {status} X', *headers]
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body
+
+
+def _json(data, *headers):
+    body = json.dumps(data).encode()
+    return _response(200, body, f'Content-Length: {len(body)}', *headers)
+
+
+class StubServer:
+    """A keep-alive HTTP/1.1 server whose routes cover each way a body can end."""
+
+    def __init__(self):
+        self.hits = Counter()
+        self.server = None
+        self.url = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, '127.0.0.1', 0)
+        self.url = f'http://127.0.0.1:{self.server.sockets[0].getsockname()[1]}'
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b'\r\n\r\n')
+                path = head.split(b' ', 2)[1].decode()
+                self.hits[path] += 1
+                if path == '/api/':
+                    writer.write(_json({'todos': f'{self.url}/api/todos/', 'notes': f'{self.url}/api/notes/',
+                                        'boom': f'{self.url}/api/boom/'}))
+                elif path == '/api/todos/':
+                    writer.write(_json({'next': None, 'results': [{'id': 7}, {'id': 6}]}))
+                elif path == '/api/todos/7/':
+                    writer.write(_response(200, b'3\r\n{"i\r\n6\r\nd": 7}\r\n0\r\n\r\n', 'Transfer-Encoding: chunked'))
+                elif path in ('/api/notes/', '/api/notes/3/'):
+                    # No length: the body ends when the server closes the connection
+                    body = b'[{"id": 3}]' if path == '/api/notes/' else b'{"id": 3}'
+                    writer.write(_response(200, body))
+                    await writer.drain()
+                    break
+                elif path == '/api/boom/':
+                    writer.write(_response(500, b'', 'Content-Length: 0'))
+                elif path == '/drop/':
+                    break
+                elif path == '/slow/':
+                    await asyncio.sleep(1)
+                    break
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+class LoadGeneratorTests(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.stub = StubServer()
+        await self.stub.start()
+
+    async def asyncTearDown(self):
+        await self.stub.stop()
+
+    async def test_chunked_and_close_delimited_bodies(self):
+        connection = HTTPConnection(self.stub.url)
+        try:
+            self.assertEqual(await connection.request('GET', '/api/todos/7/'), (200, b'{"id": 7}'))
+            self.assertEqual(await connection.request('GET', '/api/notes/3/'), (200, b'{"id": 3}'))
+            # The close-delimited body closed the connection; the next request reconnects
+            self.assertIsNone(connection.writer)
+            status, body = await connection.request('GET', '/api/todos/')
+            self.assertEqual((status, json.loads(body)['results'][0]), (200, {'id': 7}))
+        finally:
+            connection.close()
+
+    async def test_discover_endpoints_from_api_root(self):
+        paths = await discover_endpoints(self.stub.url)
+        self.assertEqual(paths, ['/api/todos/', '/api/todos/7/', '/api/notes/', '/api/notes/3/', '/api/boom/'])
+
+    async def test_discover_endpoints_from_router_paths(self):
+        paths = await discover_endpoints(self.stub.url, ['/api/notes/', '/api/boom/'])
+        self.assertEqual(paths, ['/api/notes/', '/api/notes/3/', '/api/boom/'])
+        self.assertNotIn('/api/', self.stub.hits)
+
+    async def test_run_load_sends_exactly_the_requested_count(self):
+        paths = ['/api/todos/', '/api/todos/7/', '/api/notes/']
+        summary = (await run_load(self.stub.url, paths, concurrency=4, requests=60)).summary()
+        self.assertEqual(summary['requests'], 60)
+        self.assertEqual(summary['status_codes'], {'200': 60})
+        self.assertEqual(summary['error_rate'], 0)
+        self.assertEqual(sum(self.stub.hits[path] for path in paths), 60)
+        self.assertEqual([row['requests'] for row in summary['endpoints']], [20, 20, 20])
+        self.assertEqual(sum(bucket['count'] for bucket in summary['histogram']), 60)
+
+    async def test_run_load_counts_error_statuses(self):
+        summary = (await run_load(self.stub.url, ['/api/todos/', '/api/boom/'], concurrency=1,
+                                  requests=10)).summary()
+        self.assertEqual(summary['status_codes'], {'200': 5, '500': 5})
+        self.assertEqual(summary['error_rate'], 0.5)
+        by_path = {row['path']: row for row in summary['endpoints']}
+        self.assertEqual(by_path['/api/todos/']['error_rate'], 0)
+        self.assertEqual(by_path['/api/boom/']['error_rate'], 1)
+
+    async def test_run_load_counts_timeouts_and_dropped_connections(self):
+        summary = (await run_load(self.stub.url, ['/slow/', '/drop/', '/api/todos/'], concurrency=1,
+                                  requests=6, timeout=0.1)).summary()
+        self.assertEqual(summary['requests'], 6)
+        self.assertEqual(summary['transport_errors'], {'timeout': 2, 'connection': 2})
+        self.assertEqual(summary['status_codes'], {'200': 2})
+        self.assertEqual(summary['error_rate'], round(4 / 6, 4))
+        # Failed requests have no latency
+        self.assertEqual(sum(bucket['count'] for bucket in summary['histogram']), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()